@@ -58,26 +58,17 @@ if ! command -v llama-parse &> /dev/null; then
   pip install llama-parse
 fi
 
-# Convert to JSON format
-echo -e "${YELLOW}Converting $PDF_FILE to JSON format...${NC}"
-llama-parse "$PDF_FILE" --output-raw-json --output-file "${OUTPUT_BASE}.json"
-JSON_STATUS=$?
-
-# Convert to Markdown format
-echo -e "${YELLOW}Converting $PDF_FILE to Markdown format...${NC}"
-llama-parse "$PDF_FILE" --result-type markdown --output-file "${OUTPUT_BASE}.md"
-MD_STATUS=$?
-
-# Convert to text format
-echo -e "${YELLOW}Converting $PDF_FILE to text format...${NC}"
-llama-parse "$PDF_FILE" --result-type text --output-file "${OUTPUT_BASE}.txt"
-TXT_STATUS=$?
+# Convert to JSON, Markdown and text formats; the PDF is parsed once and the
+# Markdown and text outputs are taken from the JSON result
+echo -e "${YELLOW}Converting $PDF_FILE to JSON, Markdown and text formats...${NC}"
+python src/convert_pdf.py "$PDF_FILE" --output-base "$OUTPUT_BASE"
+CONVERT_STATUS=$?
 
 # Deactivate virtual environment
 deactivate
 
 # Check the exit status
-if [ $JSON_STATUS -ne 0 ] || [ $MD_STATUS -ne 0 ] || [ $TXT_STATUS -ne 0 ]; then
+if [ $CONVERT_STATUS -ne 0 ]; then
   echo -e "${RED}❌ Error: One or more conversions failed. Check the output for details.${NC}"
   exit 1
 else
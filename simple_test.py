@@ -7,6 +7,15 @@ Tests the title extraction logic directly without importing modules.
 
 import re
 
+# Title scoring keywords, compiled once instead of rebuilt for every line:
+# substring matches, as the original keyword-in-line checks were
+STRONG_TITLE_KEYWORD_PATTERN = re.compile(r"AGREEMENT|CONTRACT|LICENSE|LEASE")
+TITLE_KEYWORD_PATTERN = re.compile(r"AGREEMENT|CONTRACT|LICENSE", re.IGNORECASE)
+AGREEMENT_TYPE_PATTERN = re.compile(
+    r"(?:service|employment|non-disclosure|confidentiality|sale|purchase|master|"
+    r"subscription|consulting|license|partnership|distribution|supply) agreement"
+)
+
 def test_title_extraction():
     """Test the title extraction logic directly"""
     # Sample contract text snippets with different title formats
@@ -39,7 +48,7 @@ def test_title_extraction():
     ]
     
     print("Testing title extraction logic...")
-    for i, (test_text, expected_title) in enumerate(test_cases):
+    for case_index, (test_text, expected_title) in enumerate(test_cases):
         # Extract title using our improved algorithm
         metadata = {"title": "Untitled Contract"}
         
@@ -48,36 +57,40 @@ def test_title_extraction():
         non_empty_lines = [line.strip() for line in lines if line.strip()]
         
         # Extract title using multiple techniques for robustness
-        potential_titles = []
-        
-        # Method 1: Look for ALL CAPS lines that could be titles
-        if non_empty_lines:
-            for i, line in enumerate(non_empty_lines[:10]):  # Check first 10 non-empty lines
+        # Method 1 (first 10 lines): ALL CAPS lines and agreement keywords
+        # Method 2 (first 15 lines): typical agreement/contract terms
+        # Both are scored in one pass over the lines; the best score wins, and on a
+        # tie the earliest line, as max() over the candidate list did
+        best_title, best_score = None, 0
+        for i, line in enumerate(non_empty_lines[:15]):
+            word_count = len(line.split())
+            line_lower = line.lower()
+            score = 0
+            
+            if i < 10:
                 # Strong title indicators: all caps + "AGREEMENT"/"CONTRACT"/"LICENSE"
-                if line.isupper() and len(line.split()) >= 2 and len(line.split()) <= 15:
-                    if any(keyword in line for keyword in ["AGREEMENT", "CONTRACT", "LICENSE", "LEASE"]):
-                        potential_titles.append((line, 10))  # High confidence score
+                if line.isupper() and word_count >= 2 and word_count <= 15:
+                    if STRONG_TITLE_KEYWORD_PATTERN.search(line):
+                        score = 10  # High confidence score
                     else:
-                        potential_titles.append((line, 5))   # Medium confidence
+                        score = 5   # Medium confidence
                 # Mixed case but has agreement keywords
-                elif any(keyword in line.upper() for keyword in ["AGREEMENT", "CONTRACT", "LICENSE"]):
-                    potential_titles.append((line, 8))
-                    
-        # Method 2: Look for lines containing typical agreement/contract terms
-        agreement_types = ["service", "employment", "non-disclosure", "confidentiality", 
-                          "sale", "purchase", "master", "subscription", "consulting", 
-                          "license", "partnership", "distribution", "supply"]
+                elif TITLE_KEYWORD_PATTERN.search(line):
+                    score = 8
+            
+            if AGREEMENT_TYPE_PATTERN.search(line_lower):
+                score = max(score, 9)
+            elif "agreement" in line_lower and word_count <= 10:
+                score = max(score, 7)
+            
+            if score > best_score:
+                best_title, best_score = line, score
+                # 10 is the top score, so no later line can beat this one
+                if best_score >= 10:
+                    break
         
-        for i, line in enumerate(non_empty_lines[:15]):  # Check more lines for this method
-            line_lower = line.lower()
-            if any(f"{term} agreement" in line_lower for term in agreement_types):
-                potential_titles.append((line, 9))
-            elif "agreement" in line_lower and len(line.split()) <= 10:
-                potential_titles.append((line, 7))
-                    
         # Select the best title based on confidence score
-        if potential_titles:
-            best_title = max(potential_titles, key=lambda x: x[1])[0]
+        if best_title is not None:
             metadata["title"] = best_title
         # If no title found with confidence, use the first non-empty line as last resort
         elif non_empty_lines:
@@ -85,7 +98,7 @@ def test_title_extraction():
         
         actual_title = metadata.get("title", "")
         
-        print(f"Test case {i+1}: ", end="")
+        print(f"Test case {case_index+1}: ", end="")
         if actual_title == expected_title:
             print(f"✓ PASS - Title correctly extracted: '{actual_title}'")
         else:
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Bulk Import CSV Writer for Contract Analysis
+
+This module writes the contract graph as the node and relationship CSV files
+read by `neo4j-admin database import`, which loads them straight into Neo4j's
+store files instead of executing Cypher statements one by one. The offline
+importer only creates new databases, so this is meant for loading a corpus in
+one go; the Cypher script remains the way to add contracts to a running
+database.
+
+Node ids are prefixed with the document id, so the CSV directories of several
+contracts can be passed to a single import.
+"""
+
+import os
+import sys
+import csv
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+
+from cypher_generator import bullet_list
+
+
+# Properties written for each node label, in column order
+NODE_PROPERTIES = {
+    "Contract": ["title", "effectiveDate", "documentType", "sourceDocument", "documentId", "importTimestamp"],
+    "Party": ["name", "type", "sourceDocument", "documentId"],
+    "Person": ["name", "title", "sourceDocument", "documentId"],
+    "Article": ["number", "title", "sourceDocument", "documentId"],
+    "Section": ["number", "title", "content", "sourceDocument", "documentId"],
+    "KeyProvision": ["number", "title", "summary", "sourceDocument", "documentId"],
+    "Financial": ["amount", "context", "sourceDocument", "documentId"],
+    "Date": ["value", "context", "sourceDocument", "documentId"],
+    "Term": ["name", "contexts", "sourceDocument", "documentId"],
+    "Entity": ["type", "values", "sourceDocument", "documentId"],
+}
+
+RELATIONSHIPS_FILE = "relationships.csv"
+IMPORT_SCRIPT = "import.sh"
+
+
+def build_import_rows(metadata: Dict[str, Any],
+                      articles: List[Dict[str, Any]],
+                      parties: List[Dict[str, Any]],
+                      document_name: str,
+                      document_id: str,
+                      timestamp: str,
+                      key_provisions: List[Dict[str, Any]] = None,
+                      financials: List[Dict[str, Any]] = None,
+                      dates: List[Dict[str, Any]] = None,
+                      terms: Dict[str, List[str]] = None,
+                      entities: Dict[str, List[str]] = None):
+    """Build the node and relationship rows for one contract.
+    
+    The graph matches the one created by the generated Cypher script.
+    
+    Returns:
+        Tuple of (rows per node label, relationship rows). Node rows hold the
+        node id followed by the label's NODE_PROPERTIES; relationship rows are
+        (start id, end id, type).
+    """
+    nodes = {label: [] for label in NODE_PROPERTIES}
+    relationships = []
+    
+    def add_node(label: str, *values: Any) -> str:
+        node_id = f"{document_id}:{label}:{len(nodes[label])}"
+        nodes[label].append([node_id, *values])
+        return node_id
+    
+    contract_id = add_node(
+        "Contract", metadata.get("title"), metadata.get("effective_date"),
+        metadata.get("document_type"), document_name, document_id, timestamp
+    )
+    
+    for party in parties:
+        party_id = add_node("Party", party["name"], party["type"], document_name, document_id)
+        relationships.append((party_id, contract_id, "PARTY_TO"))
+        for signatory in party.get("signatories", []):
+            person_id = add_node("Person", signatory["name"], signatory["title"], document_name, document_id)
+            relationships.append((person_id, party_id, "REPRESENTS"))
+    
+    for article in articles:
+        article_id = add_node("Article", article["number"], article["title"], document_name, document_id)
+        relationships.append((contract_id, article_id, "CONTAINS"))
+        for section in article.get("sections", []):
+            # Truncate content if too long
+            content = section.get("content", "")
+            if len(content) > 500:
+                content = content[:497] + "..."
+            section_id = add_node("Section", section["number"], section["title"], content,
+                                  document_name, document_id)
+            relationships.append((article_id, section_id, "HAS_SECTION"))
+    
+    for provision in key_provisions or []:
+        node_id = add_node("KeyProvision", provision.get("number", ""), provision.get("title", ""),
+                           provision.get("summary", ""), document_name, document_id)
+        relationships.append((contract_id, node_id, "HAS_KEY_PROVISION"))
+    
+    for financial in financials or []:
+        node_id = add_node("Financial", financial.get("amount", ""), financial.get("context", ""),
+                           document_name, document_id)
+        relationships.append((contract_id, node_id, "HAS_FINANCIAL"))
+    
+    for date in dates or []:
+        node_id = add_node("Date", date.get("date", ""), date.get("context", ""), document_name, document_id)
+        relationships.append((contract_id, node_id, "HAS_DATE"))
+    
+    for term_name, contexts in (terms or {}).items():
+        node_id = add_node("Term", term_name, bullet_list(contexts), document_name, document_id)
+        relationships.append((contract_id, node_id, "HAS_TERM"))
+    
+    for entity_type, entity_list in (entities or {}).items():
+        node_id = add_node("Entity", entity_type, bullet_list(entity_list), document_name, document_id)
+        relationships.append((contract_id, node_id, "HAS_ENTITY"))
+    
+    return nodes, relationships
+
+
+def write_import_script(output_dir: str, node_files: Dict[str, str]) -> str:
+    """Write a shell script running neo4j-admin on the CSV files in output_dir.
+    
+    Returns:
+        Path to the script
+    """
+    args = [f"--nodes={label}={file_name}" for label, file_name in node_files.items()]
+    args.append(f"--relationships={RELATIONSHIPS_FILE}")
+    # Section content and bullet lists span several lines
+    args.append("--multiline-fields=true")
+    
+    script_file = os.path.join(output_dir, IMPORT_SCRIPT)
+    with open(script_file, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("#!/bin/bash\n")
+        f.write("# Load these CSV files into a new Neo4j database (the database must not exist,\n")
+        f.write("# or be stopped and replaced with --overwrite-destination)\n")
+        f.write('cd "$(dirname "$0")"\n')
+        f.write('neo4j-admin database import full "${1:-neo4j}" \\\n    ')
+        f.write(" \\\n    ".join(args))
+        f.write("\n")
+    os.chmod(script_file, 0o755)
+    return script_file
+
+
+def write_admin_import_csv(input_file: str, output_dir: str,
+                           metadata: Dict[str, Any],
+                           articles: List[Dict[str, Any]],
+                           parties: List[Dict[str, Any]],
+                           key_provisions: List[Dict[str, Any]] = None,
+                           financials: List[Dict[str, Any]] = None,
+                           dates: List[Dict[str, Any]] = None,
+                           terms: Dict[str, List[str]] = None,
+                           entities: Dict[str, List[str]] = None,
+                           timestamp: Optional[str] = None) -> None:
+    """Write the contract graph as neo4j-admin import CSV files.
+    
+    One CSV file is written per node label that has nodes, plus a single
+    relationships file and an import.sh wrapper around neo4j-admin.
+    
+    Args:
+        input_file: Path to the input JSON file (used for document tracking)
+        output_dir: Directory for the CSV files
+        metadata: Contract metadata (title, date, type)
+        articles: List of articles with their sections
+        parties: List of parties with their details
+        key_provisions: List of key provisions extracted from the contract
+        financials: List of financial mentions with context
+        dates: List of date mentions with context
+        terms: Dictionary of key legal terms with context examples
+        entities: Dictionary of named entities by entity type
+        timestamp: Import timestamp for the Contract node (default: now)
+    """
+    try:
+        document_name = os.path.basename(input_file)
+        document_id = os.path.splitext(document_name)[0]  # Remove extension
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        nodes, relationships = build_import_rows(
+            metadata, articles, parties, document_name, document_id, timestamp,
+            key_provisions, financials, dates, terms, entities
+        )
+        
+        os.makedirs(output_dir, exist_ok=True)
+        node_files = {}
+        for label, rows in nodes.items():
+            if not rows:
+                continue
+            file_name = f"{label.lower()}.csv"
+            with open(os.path.join(output_dir, file_name), 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                # The id column is only used to link relationships, not stored
+                writer.writerow([":ID"] + NODE_PROPERTIES[label])
+                writer.writerows(rows)
+            node_files[label] = file_name
+        
+        with open(os.path.join(output_dir, RELATIONSHIPS_FILE), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+            writer.writerow([":START_ID", ":END_ID", ":TYPE"])
+            writer.writerows(relationships)
+        
+        write_import_script(output_dir, node_files)
+        
+        print(f"Successfully generated neo4j-admin import files in {output_dir}")
+    
+    except Exception as e:
+        print(f"Error writing import CSV files: {e}", file=sys.stderr)
+        raise
@@ -5,8 +5,14 @@ Contract Constants and Pattern Definitions
 This module contains constants and pattern definitions used in legal document processing,
 including regex patterns, spaCy matcher patterns, and various mappings used for
 contract analysis.
+
+Regex pattern lists are compiled once at import time so callers can use the
+pattern objects directly (e.g. ``pattern.finditer(text)``).
 """
 
+import functools
+import re
+
 # Mapping for numeric to Roman numerals for article identification
 ROMAN_TO_NUMBER = {
     "I": "1", "II": "2", "III": "3", "IV": "4", "V": "5",
@@ -15,23 +21,65 @@ ROMAN_TO_NUMBER = {
     "XVI": "16", "XVII": "17", "XVIII": "18", "XIX": "19", "XX": "20",
 }
 
-# Regex patterns for recognizing article headers and sections
-ARTICLE_PATTERNS = [
-    r"ARTICLE\s+([IVXivx]+)\s*[-–—.:]\s*(.*?)(?=$|\n)",
-    r"ARTICLE\s+(\d+)\s*[-–—.:]\s*(.*?)(?=$|\n)",
-    r"(\d+)\.\s*([A-Z][A-Za-z\s]+)(?=$|\n)",
+# Article numbers as they usually appear (upper/lower-case Roman numerals and
+# plain digits) mapped straight to their numeric id, so the common cases need
+# no .upper() call; mixed-case numerals still go through ROMAN_TO_NUMBER
+NUMERIC_IDS = {
+    **ROMAN_TO_NUMBER,
+    **{roman.lower(): number for roman, number in ROMAN_TO_NUMBER.items()},
+    **{number: number for number in ROMAN_TO_NUMBER.values()}
+}
+
+# Regex patterns for recognizing article headers and sections. None of them
+# anchors on ^ or $, so they are compiled without re.MULTILINE and end-of-line
+# is spelled (?=\n|\Z)
+ARTICLE_PATTERNS = [re.compile(p) for p in (
+    r"ARTICLE\s+([IVXivx]+)\s*[-–—.:]\s*(.*?)(?=\n|\Z)",
+    r"ARTICLE\s+(\d+)\s*[-–—.:]\s*(.*?)(?=\n|\Z)",
+    r"(\d+)\.\s*([A-Z][A-Za-z\s]+)(?=\n|\Z)",
     r"([A-Z][A-Za-z\s]+)\s*\n",
-    r"SECTION\s+(\d+)[.:]\s*(.*?)(?=$|\n)"
+    r"SECTION\s+(\d+)[.:]\s*(.*?)(?=\n|\Z)"
+)]
+
+# Case-insensitive variants of the article patterns
+ARTICLE_PATTERNS_IGNORECASE = [
+    re.compile(p.pattern, re.IGNORECASE) for p in ARTICLE_PATTERNS
 ]
 
 # Regex patterns for sections
-SECTION_PATTERNS = [
-    r"(\d+\.\d+)\s+(.*?)(?=$|\n)",
-    r"(\d+\.\d+\.\d+)\s+(.*?)(?=$|\n)",
-    r"(\d+\.\d+[a-z])\s+(.*?)(?=$|\n)",
-    r"([A-Za-z])\.\s+(.*?)(?=$|\n)",
-    r"\(([a-z])\)\s+(.*?)(?=$|\n)"
-]
+SECTION_PATTERNS = [re.compile(p) for p in (
+    r"(\d+\.\d+)\s+(.*?)(?=\n|\Z)",
+    r"(\d+\.\d+\.\d+)\s+(.*?)(?=\n|\Z)",
+    r"(\d+\.\d+[a-z])\s+(.*?)(?=\n|\Z)",
+    r"([A-Za-z])\.\s+(.*?)(?=\n|\Z)",
+    r"\(([a-z])\)\s+(.*?)(?=\n|\Z)"
+)]
+
+# Quick screens applied with .match() before the full patterns above: a
+# sentence that may be an article header, a sentence that may be a section
+# header ("1.2 Title" or "a) Title"), and a ContractBERT entity that may be one
+ARTICLE_HEADER_START_PATTERN = re.compile(r"ARTICLE|Article|Section|\d+\.\s*[A-Z]")
+SECTION_HEADER_START_PATTERN = re.compile(r"\d+\.\d+\s+[A-Z]|[a-z]\)\s+[A-Z]")
+SECTION_ENTITY_START_PATTERN = re.compile(r"\d+\.\d+\s+\w+|\([a-z]\)\s+\w+")
+
+
+def _build_union(patterns, prefix, flags):
+    """Fuse patterns into one alternation of named groups.
+
+    Returns the compiled union and a mapping from each alternative's group
+    name to the indices of its own capture groups, so callers can dispatch on
+    ``match.lastgroup`` after a single scan of the text.
+    """
+    union = re.compile(
+        "|".join(f"(?P<{prefix}{i}>{p.pattern})" for i, p in enumerate(patterns)),
+        flags
+    )
+    groups = {}
+    for i, p in enumerate(patterns):
+        start = union.groupindex[f"{prefix}{i}"]
+        groups[f"{prefix}{i}"] = tuple(range(start + 1, start + 1 + p.groups))
+    return union, groups
+
 
 # spaCy matcher patterns for definitions
 DEFINITION_PATTERNS = [
@@ -70,12 +118,48 @@ PAYMENT_PATTERNS = [
     [{"LOWER": {"IN": ["pay", "reimburse", "compensate"]}}, {"POS": "DET"}, {"OP": "*"}]
 ]
 
+# Match IDs for the combined clause matcher
+CLAUSE_MATCHER_PATTERNS = {
+    "DEFINITION": DEFINITION_PATTERNS,
+    "OBLIGATION": OBLIGATION_PATTERNS,
+    "CONDITION": CONDITION_PATTERNS,
+    "TERM": TERM_PATTERNS,
+    "PAYMENT": PAYMENT_PATTERNS
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_clause_matcher(vocab):
+    """Return a spaCy Matcher holding every clause pattern list, built once per vocab.
+
+    Match IDs are the CLAUSE_MATCHER_PATTERNS keys. Run it over a stream of
+    docs instead of rebuilding it per document, e.g.
+    ``matcher = build_clause_matcher(nlp.vocab)`` then
+    ``for doc in nlp.pipe(texts): matches = matcher(doc)``.
+    """
+    # Imported here so the regex-only callers don't need spaCy installed
+    from spacy.matcher import Matcher
+    
+    matcher = Matcher(vocab)
+    for key, patterns in CLAUSE_MATCHER_PATTERNS.items():
+        matcher.add(key, patterns)
+    return matcher
+
 # Regex patterns for contract title extraction
-TITLE_PATTERNS = [
+TITLE_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
     r"(.*?(?:AGREEMENT|CONTRACT))",  # Standard AGREEMENT/CONTRACT endings
     r"(^.+?(?=Between|BETWEEN|between))",  # Text before "Between"
     r"(^[A-Z\s]+(?:\s*[-–—]\s*[A-Z\s]+)?)"  # All-caps text possibly with a dash
-]
+)]
+
+# Keywords that score a line as a title candidate in the TXT title heuristics;
+# like the keyword-in-line checks they replace, these match substrings
+STRONG_TITLE_KEYWORD_PATTERN = re.compile(r"AGREEMENT|CONTRACT|LICENSE|LEASE")
+TITLE_KEYWORD_PATTERN = re.compile(r"AGREEMENT|CONTRACT|LICENSE", re.IGNORECASE)
+AGREEMENT_TYPE_PATTERN = re.compile(
+    r"(?:service|employment|non-disclosure|confidentiality|sale|purchase|master|"
+    r"subscription|consulting|license|partnership|distribution|supply) agreement"
+)
 
 # Document type classification patterns
 DOC_TYPES = {
@@ -88,6 +172,10 @@ DOC_TYPES = {
     "Merger Agreement": ["merger", "acquire", "acquisition", "combine"]
 }
 
+# DOC_TYPES labels compiled once, for the metadata party-type check that
+# searches ORG entity names for them
+DOC_TYPE_LABEL_PATTERNS = [(re.compile(label), keywords) for label, keywords in DOC_TYPES.items()]
+
 # Date context patterns for effective date identification
 DATE_CONTEXTS = [
     "effective date",  # This should match with or without colon
@@ -98,17 +186,17 @@ DATE_CONTEXTS = [
 ]
 
 # Entity patterns for party extraction
-ENTITY_PATTERNS = [
+ENTITY_PATTERNS = [re.compile(p, re.MULTILINE) for p in (
     # Name + entity type in parentheses
     r"([A-Za-z0-9\s,\.&]+)(?:\((?:a|an)\s+([^)]+)\))",
     # Name + Inc./LLC/Ltd./Corp./etc.
     r"([A-Za-z0-9\s,\.&]+(?:Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|B\.V\.|GmbH|S\.A\.|S\.p\.A\.))\s*(?:\([^)]*\))?",
     # Name followed by jurisdiction indicator
     r"([A-Za-z0-9\s,\.&]+),\s*(?:a|an)\s+([A-Za-z\s]+(?:corporation|company|partnership|entity|organization))"
-]
+)]
 
 # Organization types for entity classification
-ORG_TYPES = [
+ORG_TYPES = [(re.compile(p), label) for p, label in (
     (r"Inc\.|Corporation|Corp\.", "Corporation"),
     (r"LLC", "Limited Liability Company"),
     (r"Ltd\.|Limited", "Limited Company"),
@@ -120,20 +208,52 @@ ORG_TYPES = [
     (r"ApS", "Danish Private Limited Company"),
     (r"OY|OYJ", "Finnish Company"),
     (r"PLC|P\.L\.C\.", "Public Limited Company")
-]
+)]
 
 # Signature patterns for extracting signatories
-SIGNATURE_PATTERNS = [
+SIGNATURE_PATTERNS = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
     r"(?:For|By):\s*([A-Za-z0-9\s,\.&]+)\s*[_\s-]*\s*(?:Name|Signature):\s*([A-Za-z\s\.-]+)\s*(?:Title|Position):\s*([A-Za-z\s\.-]+)",
     r"([A-Za-z0-9\s,\.&]+)\s*\n\s*By:\s*[_\s-]*\s*\n\s*Name:\s*([A-Za-z\s\.-]+)\s*\n\s*Title:\s*([A-Za-z\s\.-]+)"
-]
+)]
+
+# Single-scan union of the signature block patterns
+SIGNATURE_UNION, SIGNATURE_UNION_GROUPS = _build_union(
+    SIGNATURE_PATTERNS, "sig", re.IGNORECASE | re.MULTILINE
+)
 
 # Party indicators for regex extraction
-PARTY_INDICATORS = [
+PARTY_INDICATORS = [re.compile(p, re.MULTILINE) for p in (
     r"([A-Za-z0-9\s,\.]+?(?:Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|B\.V\.|GmbH|S\.A\.|S\.p\.A\.))",
     r"([A-Za-z0-9\s,\.]+?(?:\(\".*?\"\)))",  # Company name followed by defined term in quotes
     r"([A-Za-z0-9\s,\.]+?(?:\([A-Za-z0-9\s,\.]+?\)))"  # Company name followed by jurisdiction in parentheses
-]
+)]
+
+# Legal-form suffixes and corporate keywords that mark an ORG entity as a
+# likely contracting party
+LEGAL_SUFFIX_PATTERN = re.compile(r"Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|B\.V\.|GmbH")
+CORPORATE_KEYWORD_PATTERN = re.compile(r"Company|Corporation|Technologies|Systems|International")
+
+# Either of the party markers used by the metadata ORG filter in one scan: a
+# case-sensitive legal suffix or a case-insensitive corporate keyword
+PARTY_MARKER_PATTERN = re.compile(
+    LEGAL_SUFFIX_PATTERN.pattern + r"|(?i:company|corporation|technologies|systems)"
+)
+
+# "Between <party> and <party>" block at the top of a contract
+BETWEEN_PARTIES_PATTERN = re.compile(
+    r"Between\s+(.+?)\s+and\s+(.+?)(?=\s+(?:Effective Date|WITNESSETH|WHEREAS|NOW, THEREFORE|$))",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Runs of whitespace collapsed to a single space when normalizing party names
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
+# Explicit "Effective Date: <Month DD, YYYY>" line and bare "Month DD, YYYY" dates
+EFFECTIVE_DATE_PATTERN = re.compile(r"Effective\s+Date:\s*([A-Za-z]+\s+\d{1,2},\s*\d{4})")
+MONTH_DAY_YEAR_PATTERN = re.compile(r"([A-Z][a-z]+\s+\d{1,2},\s*\d{4})")
+
+# Punctuation blanked out before looking for dates near their context words
+DATE_PUNCTUATION_PATTERN = re.compile(r"[.:,;]")
 
 # Financial pattern matching for monetary values
 FINANCIAL_PATTERNS = [
@@ -147,13 +267,13 @@ FINANCIAL_PATTERNS = [
 ]
 
 # Date pattern matching for various date formats
-DATE_PATTERNS = [
+DATE_PATTERNS = [re.compile(p) for p in (
     r'(\d{1,2}\/\d{1,2}\/\d{2,4})',  # MM/DD/YYYY, M/D/YY
     r'([A-Z][a-z]+ \d{1,2}, \d{4})',  # Month DD, YYYY
     r'(\d{1,2} [A-Z][a-z]+ \d{4})',  # DD Month YYYY
     r'within (\d+) (?:days|weeks|months|years)',  # within X days/weeks/months
     r'(\d+) (?:days|weeks|months|years) (?:after|from|of)'  # X days/weeks/months after/from
-]
+)]
 
 # Key legal terms pattern matching
 KEY_TERM_PATTERNS = {
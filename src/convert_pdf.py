@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+PDF Converter
+
+This script parses PDF contracts with LlamaParse and writes the JSON, Markdown
+and text outputs used by the rest of the pipeline. Each document is parsed once:
+the raw JSON result already carries each page's Markdown and text, so the other
+two formats are rendered from it instead of being requested again. Several PDFs
+can be given at once; they are submitted to LlamaParse as one batch, which runs
+their parse jobs concurrently on the service side. Parse results are
+cached on disk by the PDF's content, so re-running on an unchanged file makes
+no API call at all.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import tempfile
+import argparse
+import functools
+import importlib.metadata
+from typing import Dict, List, Any, Optional
+
+# orjson serializes large parse results several times faster than the stdlib
+# encoder; without it the converter falls back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Separator and per-page header written by `llama-parse --output-file`, kept so
+# the .md/.txt files stay identical to the ones the CLI produced
+PAGE_SEPARATOR = "\n\n---\n\n"
+PAGE_HEADER = "File: Unknown\n"
+
+# Output file extension -> page field holding that rendering
+PAGE_FIELDS = {"md": "md", "txt": "text"}
+
+# Number of LlamaParse jobs run at the same time in batch mode; llama-parse
+# 0.5.x rejects num_workers of 10 or more
+DEFAULT_WORKERS = 8
+MAX_WORKERS = 9
+
+# Where raw parse results are cached, and the block size used to hash PDFs
+CACHE_DIR = os.environ.get(
+    "LLAMAPARSE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "llamaparse_neo4j")
+)
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, read in blocks so large PDFs are not loaded whole."""
+    with open(path, 'rb') as f:
+        # Python 3.11+ hashes the file in OpenSSL straight from its buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        # Older versions: reuse one buffer instead of allocating each block
+        digest = hashlib.sha256()
+        buffer = memoryview(bytearray(HASH_BLOCK_SIZE))
+        for size in iter(lambda: f.readinto(buffer), 0):
+            digest.update(buffer[:size])
+    return digest.hexdigest()
+
+
+def parser_version() -> str:
+    """Installed llama-parse version; part of the cache key so upgrades re-parse."""
+    try:
+        return importlib.metadata.version("llama-parse")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cache_path_for(pdf_file: str) -> str:
+    """Cache file for a PDF's parse result, keyed by parser version and content."""
+    key = hashlib.sha256(f"{parser_version()}:{file_digest(pdf_file)}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_cached(cache_file: str, pdf_file: str) -> List[Dict[str, Any]]:
+    """Read a cached parse result for pdf_file."""
+    with open(cache_file, 'rb') as f:
+        json_result = load_json(f.read())
+    # The cached result may come from a copy of the PDF at another path
+    for document in json_result:
+        document["file_path"] = pdf_file
+    return json_result
+
+
+def store_cached(cache_file: str, json_result: List[Dict[str, Any]]) -> None:
+    """Atomically write a parse result to the cache."""
+    # Serialized before the temporary file exists, so an encoding error
+    # leaves nothing behind
+    data = dump_json(json_result)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser(num_workers: int):
+    """Shared LlamaParse client, so repeated calls reuse its configuration and
+    HTTP connections instead of setting them up for every parse."""
+    # Imported here: llama-parse is slow to import and a cache hit or --help
+    # never needs it
+    from llama_parse import LlamaParse
+    
+    return LlamaParse(num_workers=num_workers)
+
+
+def parse_pdfs(pdf_files: List[str], use_cache: bool = True,
+               workers: int = DEFAULT_WORKERS) -> Dict[str, List[Dict[str, Any]]]:
+    """Parse PDFs with LlamaParse and return each one's raw JSON result.
+    
+    PDFs not found in the cache are submitted together in one LlamaParse
+    batch, which uploads and polls up to `workers` jobs concurrently.
+    
+    Args:
+        pdf_files: Paths to the PDF files
+        use_cache: Reuse (and store) the results cached for identical PDF content
+        workers: Number of concurrent LlamaParse jobs
+    
+    Returns:
+        Mapping from PDF path to its parse result; PDFs that failed to parse
+        are left out
+    """
+    results = {}
+    cache_files = {}
+    for pdf_file in pdf_files:
+        cache_file = cache_path_for(pdf_file) if use_cache else None
+        if cache_file and os.path.exists(cache_file):
+            results[pdf_file] = load_cached(cache_file, pdf_file)
+        else:
+            cache_files[pdf_file] = cache_file
+    
+    if not cache_files:
+        return results
+    
+    parser = get_parser(max(1, min(workers, MAX_WORKERS)))
+    
+    # The batch result is a flat list of documents; failed files are dropped
+    # from it, so documents are matched back to their PDF by file_path
+    parsed = {}
+    for document in parser.get_json_result(list(cache_files)):
+        parsed.setdefault(document.get("file_path"), []).append(document)
+    
+    for pdf_file, cache_file in cache_files.items():
+        json_result = parsed.get(pdf_file)
+        if not json_result:
+            continue
+        results[pdf_file] = json_result
+        # Only complete results are cached
+        if cache_file and all(document.get("pages") for document in json_result):
+            store_cached(cache_file, json_result)
+    
+    return results
+
+
+def dump_json(json_result: List[Dict[str, Any]]) -> bytes:
+    """Serialize a parse result to UTF-8 JSON in one call.
+    
+    json.dump() on a file issues a write per encoded fragment; encoding the
+    whole result first and writing it once is considerably faster.
+    """
+    if orjson is not None:
+        return orjson.dumps(json_result)
+    return json.dumps(json_result).encode('utf-8')
+
+
+def load_json(data: bytes) -> List[Dict[str, Any]]:
+    """Deserialize a cached parse result."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_output(path: str, data: bytes) -> None:
+    """Write an output file with a single binary write."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def render_pages(json_result: List[Dict[str, Any]], field: str) -> str:
+    """Join one field of every parsed page into a single document."""
+    return PAGE_SEPARATOR.join(
+        PAGE_HEADER + page[field]
+        for document in json_result
+        for page in document["pages"]
+    )
+
+
+def write_outputs(json_result: List[Dict[str, Any]], output_base: str) -> List[str]:
+    """Write <output_base>.json, .md and .txt for one parse result.
+    
+    Returns:
+        The paths of the files written
+    """
+    # Everything is rendered before anything is written, so a result without
+    # the expected pages fails here instead of leaving partial outputs behind
+    try:
+        outputs = {"json": dump_json(json_result)}
+        for extension, field in PAGE_FIELDS.items():
+            outputs[extension] = render_pages(json_result, field).encode('utf-8')
+    except (KeyError, TypeError) as e:
+        raise RuntimeError(f"Unexpected LlamaParse result structure: missing {e}") from e
+    
+    output_files = []
+    for extension, data in outputs.items():
+        output_file = f"{output_base}.{extension}"
+        write_output(output_file, data)
+        output_files.append(output_file)
+    
+    return output_files
+
+
+def convert_pdf(pdf_file: str, output_base: str, use_cache: bool = True) -> List[str]:
+    """Convert a PDF to <output_base>.json, .md and .txt from a single parse.
+    
+    Returns:
+        The paths of the files written
+    """
+    json_result = parse_pdfs([pdf_file], use_cache).get(pdf_file)
+    if not json_result:
+        raise RuntimeError(f"LlamaParse returned no result for {pdf_file}")
+    return write_outputs(json_result, output_base)
+
+
+def output_base_for(pdf_file: str, output_dir: Optional[str] = None) -> str:
+    """Output path without extension for a PDF, optionally moved to output_dir."""
+    output_base = os.path.splitext(pdf_file)[0]
+    if output_dir:
+        output_base = os.path.join(output_dir, os.path.basename(output_base))
+    return output_base
+
+
+def main():
+    """Main function to process command line arguments."""
+    parser = argparse.ArgumentParser(description='Convert PDFs to JSON, Markdown and text with LlamaParse')
+    parser.add_argument('pdf_files', nargs='+', help='Paths to the input PDF files')
+    parser.add_argument('--output-base', '-o', type=str, default=None,
+                        help='Output path without extension (single input file only)')
+    parser.add_argument('--output-dir', '-d', type=str, default=None,
+                        help='Directory for the output files (default: next to each PDF)')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_WORKERS,
+                        help=f'Number of LlamaParse jobs to run concurrently (1-{MAX_WORKERS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always call LlamaParse instead of reusing cached results')
+    
+    args = parser.parse_args()
+    if args.output_base and len(args.pdf_files) > 1:
+        parser.error("--output-base can only be used with a single PDF file")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    
+    jobs = {
+        pdf_file: args.output_base or output_base_for(pdf_file, args.output_dir)
+        for pdf_file in args.pdf_files
+    }
+    
+    print(f"Parsing {len(jobs)} PDF file(s) with LlamaParse...")
+    try:
+        results = parse_pdfs(list(jobs), not args.no_cache, args.workers)
+    except Exception as e:
+        print(f"Error parsing PDF files: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    failed = False
+    for pdf_file, output_base in jobs.items():
+        json_result = results.get(pdf_file)
+        if not json_result:
+            print(f"Error converting {pdf_file}: LlamaParse returned no result", file=sys.stderr)
+            failed = True
+            continue
+        try:
+            print(f"Created {', '.join(write_outputs(json_result, output_base))}")
+        except Exception as e:
+            print(f"Error converting {pdf_file}: {e}", file=sys.stderr)
+            failed = True
+    
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,16 +11,121 @@ import re
 import json
 import sys
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
 
+# Parameterized statements for the core contract graph. The query text is the
+# same for every document, so Neo4j can reuse the cached plan and the values
+# never need quoting or escaping.
+CONTRACT_QUERY = "CREATE (c:Contract $contract)"
+# Shared prefix binding the document's Contract node as c (index-backed, see
+# CYPHER_SCRIPT_HEADER)
+CONTRACT_MATCH = "MATCH (c:Contract {documentId: $documentId}) "
+PARTIES_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $parties AS row "
+    "CREATE (p:Party {name: row.name, type: row.type, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})-[:PARTY_TO]->(c) "
+    "WITH p, row UNWIND row.signatories AS sig "
+    "CREATE (s:Person {name: sig.name, title: sig.title, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})-[:REPRESENTS]->(p)"
+)
+ARTICLES_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $articles AS row "
+    "CREATE (c)-[:CONTAINS]->(a:Article {number: row.number, title: row.title, "
+    "sourceDocument: $sourceDocument, documentId: $documentId}) "
+    "WITH a, row UNWIND row.sections AS sec "
+    "CREATE (a)-[:HAS_SECTION]->(s:Section {number: sec.number, title: sec.title, "
+    "content: sec.content, sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+
+KEY_PROVISIONS_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $provisions AS row "
+    "CREATE (c)-[:HAS_KEY_PROVISION]->(kp:KeyProvision {number: row.number, title: row.title, "
+    "summary: row.summary, sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+FINANCIALS_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $financials AS row "
+    "CREATE (c)-[:HAS_FINANCIAL]->(f:Financial {amount: row.amount, context: row.context, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+DATES_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $dates AS row "
+    "CREATE (c)-[:HAS_DATE]->(d:Date {value: row.value, context: row.context, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+TERMS_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $terms AS row "
+    "CREATE (c)-[:HAS_TERM]->(t:Term {name: row.name, contexts: row.contexts, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+ENTITIES_QUERY = (
+    CONTRACT_MATCH +
+    "UNWIND $entities AS row "
+    "CREATE (c)-[:HAS_ENTITY]->(e:Entity {type: row.type, values: row.values, "
+    "sourceDocument: $sourceDocument, documentId: $documentId})"
+)
+
+# Maximum rows per UNWIND statement. 04.execute_cypher.sh drops the BEGIN/COMMIT
+# wrapper, so cypher-shell commits each statement on its own and this bounds
+# how much Neo4j has to hold in memory per transaction.
+BATCH_SIZE = 1000
+
+# Fixed preamble of every generated script; %s is the generation timestamp
+CYPHER_SCRIPT_HEADER = (
+    "// Neo4j Cypher Import Script\n"
+    "// Generated on %s\n"
+    "// This script will create a graph representation of the contract\n\n"
+    # Every batch looks its Contract up by documentId; the index turns that
+    # lookup into a seek instead of a label scan. Schema changes cannot share
+    # a transaction with data writes, so it comes before BEGIN.
+    "CREATE INDEX contract_document_id IF NOT EXISTS FOR (c:Contract) ON (c.documentId);\n\n"
+    # Add a transaction wrapper
+    "BEGIN\n\n"
+    # First, add a statement to clear existing data (commented out by default)
+    "// Uncomment to clear existing data before import\n"
+    "// MATCH (n) DETACH DELETE n;\n\n"
+)
+
+
+def _cypher_literal(value: Any) -> str:
+    """Render a Python value as a Cypher literal for a :param line."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"`{k}`: {_cypher_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_cypher_literal(v) for v in value) + "]"
+    # JSON string escapes (\", \\, \n, \uXXXX) are valid in Cypher string literals
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _batch_commands(query: str, source: Dict[str, Any], rows_key: str,
+                    rows: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Split rows for an UNWIND query into (query, parameters) pairs of at
+    most BATCH_SIZE rows each; no rows give no commands."""
+    return [
+        (query, dict(source, **{rows_key: rows[start:start + BATCH_SIZE]}))
+        for start in range(0, len(rows), BATCH_SIZE)
+    ]
+
+
 def generate_neo4j_cypher(contract_metadata: Dict[str, Any], 
                          articles: List[Dict[str, Any]], 
                          parties: List[Dict[str, Any]], 
                          document_name: str, 
                          document_id: str, 
-                         timestamp: str) -> List[str]:
+                         timestamp: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for Neo4j database.
     
     Args:
@@ -32,121 +137,92 @@ def generate_neo4j_cypher(contract_metadata: Dict[str, Any],
         timestamp: Timestamp of the import
         
     Returns:
-        List of Cypher commands ready to be executed in Neo4j
+        List of (query, parameters) pairs ready to be executed in Neo4j
     """
     cypher_commands = []
+    source = {"sourceDocument": document_name, "documentId": document_id}
     
     # Create Contract node
-    contract_cypher = (
-        f"CREATE (c:Contract {{title: '{contract_metadata['title']}', "
-        f"effectiveDate: '{contract_metadata['effective_date']}', "
-        f"documentType: '{contract_metadata['document_type']}', "
-        f"sourceDocument: '{document_name}', "
-        f"documentId: '{document_id}', "
-        f"importTimestamp: '{timestamp}' }})"
-    )
-    cypher_commands.append(contract_cypher)
-    
-    # Create Party nodes and relationships to Contract
-    for idx, party in enumerate(parties):
-        party_id = f"p{idx}"
-        party_cypher = (
-            f"CREATE ({party_id}:Party {{name: '{party['name']}', "
-            f"type: '{party['type']}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(party_cypher)
-        
-        # Create relationship between Party and Contract
-        rel_cypher = f"CREATE ({party_id})-[:PARTY_TO]->(c)"
-        cypher_commands.append(rel_cypher)
-        
-        # Create Signatory nodes
-        for sig_idx, signatory in enumerate(party.get("signatories", [])):
-            sig_id = f"s{idx}_{sig_idx}"
-            sig_cypher = (
-                f"CREATE ({sig_id}:Person {{name: '{signatory['name']}', "
-                f"title: '{signatory['title']}', "
-                f"sourceDocument: '{document_name}', "
-                f"documentId: '{document_id}' }})"
-            )
-            cypher_commands.append(sig_cypher)
-            
-            # Create relationship between Signatory and Party
-            sig_rel_cypher = f"CREATE ({sig_id})-[:REPRESENTS]->({party_id})"
-            cypher_commands.append(sig_rel_cypher)
+    contract = {
+        "title": contract_metadata["title"],
+        "effectiveDate": contract_metadata["effective_date"],
+        "documentType": contract_metadata["document_type"],
+        "sourceDocument": document_name,
+        "documentId": document_id,
+        "importTimestamp": timestamp
+    }
+    cypher_commands.append((CONTRACT_QUERY, {"contract": contract}))
     
-    # Create Article nodes and relationships to Contract
-    for idx, article in enumerate(articles):
-        article_id = f"a{idx}"
-        article_cypher = (
-            f"CREATE ({article_id}:Article {{number: '{article['number']}', "
-            f"title: '{article['title']}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(article_cypher)
-        
-        # Create relationship between Article and Contract
-        art_rel_cypher = f"CREATE (c)-[:CONTAINS]->({article_id})"
-        cypher_commands.append(art_rel_cypher)
-        
-        # Create Section nodes and relationships to Article
-        for sec_idx, section in enumerate(article.get("sections", [])):
-            sec_id = f"s{idx}_{sec_idx}"
-            # Escape single quotes in content
-            content = section.get("content", "").replace("'", "\\'")
+    # Create Party and Signatory nodes with their relationships in batches
+    party_rows = [
+        {
+            "name": party["name"],
+            "type": party["type"],
+            "signatories": [
+                {"name": signatory["name"], "title": signatory["title"]}
+                for signatory in party.get("signatories", [])
+            ]
+        }
+        for party in parties
+    ]
+    cypher_commands.extend(_batch_commands(PARTIES_QUERY, source, "parties", party_rows))
+        
+    # Create Article and Section nodes with their relationships in batches
+    article_rows = []
+    for article in articles:
+        section_rows = []
+        for section in article.get("sections", []):
             # Truncate content if too long
+            content = section.get("content", "")
             if len(content) > 500:
                 content = content[:497] + "..."
                 
-            sec_cypher = (
-                f"CREATE ({sec_id}:Section {{number: '{section['number']}', "
-                f"title: '{section['title']}', "
-                f"content: '{content}', "
-                f"sourceDocument: '{document_name}', "
-                f"documentId: '{document_id}' }})"
-            )
-            cypher_commands.append(sec_cypher)
-            
-            # Create relationship between Section and Article
-            sec_rel_cypher = f"CREATE ({article_id})-[:HAS_SECTION]->({sec_id})"
-            cypher_commands.append(sec_rel_cypher)
+            section_rows.append({"number": section["number"], "title": section["title"], "content": content})
+        article_rows.append({"number": article["number"], "title": article["title"], "sections": section_rows})
+    cypher_commands.extend(_batch_commands(ARTICLES_QUERY, source, "articles", article_rows))
     
     return cypher_commands
 
 
-def write_cypher_to_file(cypher_commands: List[str], output_file: str) -> None:
+def _render_commands(cypher_commands: List[Union[str, Tuple[str, Dict[str, Any]]]]):
+    """Yield the script lines for cypher_commands, each ending in a newline."""
+    for cmd in cypher_commands:
+        if isinstance(cmd, tuple):
+            query, params = cmd
+            for name, value in params.items():
+                yield f":param {name} => {_cypher_literal(value)}\n"
+            cmd = query
+        yield f"{cmd};\n"
+
+
+def write_cypher_to_file(cypher_commands: List[Union[str, Tuple[str, Dict[str, Any]]]],
+                         output_file: str, timestamp: Optional[str] = None) -> None:
     """Write Cypher commands to an output file.
     
+    Parameterized commands are written as cypher-shell ``:param`` lines
+    followed by the query that uses them.
+    
     Args:
-        cypher_commands: List of Cypher commands to write
+        cypher_commands: List of Cypher commands or (query, parameters) pairs to write
         output_file: Path to the output file
+        timestamp: Generation time for the header (default: now)
     """
     try:
-        with open(output_file, 'w') as f:
-            f.write("// Neo4j Cypher Import Script\n")
-            f.write(f"// Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("// This script will create a graph representation of the contract\n\n")
-            
-            # Add a transaction wrapper
-            f.write("BEGIN\n\n")
-            
-            # First, add a statement to clear existing data (commented out by default)
-            f.write("// Uncomment to clear existing data before import\n")
-            f.write("// MATCH (n) DETACH DELETE n;\n\n")
-            
-            # Write each Cypher command
-            for cmd in cypher_commands:
-                f.write(f"{cmd};\n")
+        if timestamp is None:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        header = CYPHER_SCRIPT_HEADER % timestamp
             
+        # Lines are streamed through the 1 MiB buffer as they are rendered
+        # instead of building the whole script in memory first
+        with open(output_file, 'w', buffering=1 << 20, encoding='utf-8', newline='\n') as f:
+            f.write(header)
+            f.writelines(_render_commands(cypher_commands))
             f.write("\nCOMMIT\n")
         
         print(f"Successfully generated Neo4j Cypher commands in {output_file}")
         
     except Exception as e:
-        print(f"Error writing Cypher file: {e}")
+        print(f"Error writing Cypher file: {e}", file=sys.stderr)
         raise
 
 
@@ -158,7 +234,8 @@ def process_json_file(input_file: str, output_file: str,
                      financials: List[Dict[str, Any]] = None,
                      dates: List[Dict[str, Any]] = None,
                      terms: Dict[str, List[str]] = None,
-                     entities: Dict[str, List[str]] = None) -> None:
+                     entities: Dict[str, List[str]] = None,
+                     timestamp: Optional[str] = None) -> None:
     """Process the input JSON file and generate Neo4j Cypher commands.
     
     Args:
@@ -172,12 +249,14 @@ def process_json_file(input_file: str, output_file: str,
         dates: List of date mentions with context
         terms: Dictionary of key legal terms with context examples
         entities: Dictionary of named entities by entity type
+        timestamp: Import timestamp for the Contract node (default: now)
     """
     try:
         # Get the filename for document tracking
         document_name = os.path.basename(input_file)
         document_id = os.path.splitext(document_name)[0]  # Remove extension
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Generate basic Cypher commands
         cypher_commands = generate_neo4j_cypher(
@@ -211,18 +290,22 @@ def process_json_file(input_file: str, output_file: str,
             )
         
         # Write Cypher commands to output file
-        write_cypher_to_file(cypher_commands, output_file)
-        
-        print(f"Successfully generated Neo4j Cypher commands in {output_file}")
+        # The header carries the same timestamp as the imported nodes
+        write_cypher_to_file(cypher_commands, output_file, timestamp)
         
     except Exception as e:
         print(f"Error processing JSON file: {e}", file=sys.stderr)
         raise
 
 
+def bullet_list(items: List[str]) -> str:
+    """Format items as a bullet-point list, one per line, dropping repeats."""
+    return "• " + "\n• ".join(dict.fromkeys(items))
+
+
 def generate_key_provisions_cypher(key_provisions: List[Dict[str, Any]], 
                                  document_name: str, 
-                                 document_id: str) -> List[str]:
+                                 document_id: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for key provisions.
     
     Args:
@@ -231,42 +314,23 @@ def generate_key_provisions_cypher(key_provisions: List[Dict[str, Any]],
         document_id: Identifier of the source document
         
     Returns:
-        List of Cypher commands for key provisions
+        List of (query, parameters) pairs for key provisions
     """
-    cypher_commands = []
-    
-    # Find the contract node reference
-    contract_ref = "(c:Contract {documentId: '" + document_id + "'})"
-    
-    for idx, provision in enumerate(key_provisions):
-        # Clean text for Cypher query
-        number = provision.get("number", "").replace("'", "\\'")
-        title = provision.get("title", "").replace("'", "\\'")
-        summary = provision.get("summary", "").replace("'", "\\'")
-        
-        # Create a unique ID for the provision node
-        provision_id = f"kp{idx}"
-        
-        # Create provision node
-        provision_cypher = (
-            f"CREATE ({provision_id}:KeyProvision {{number: '{number}', "
-            f"title: '{title}', "
-            f"summary: '{summary}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(provision_cypher)
-        
-        # Link to contract
-        rel_cypher = f"MATCH {contract_ref} CREATE (c)-[:HAS_KEY_PROVISION]->({provision_id})"
-        cypher_commands.append(rel_cypher)
-    
-    return cypher_commands
+    provision_rows = [
+        {
+            "number": provision.get("number", ""),
+            "title": provision.get("title", ""),
+            "summary": provision.get("summary", "")
+        }
+        for provision in key_provisions
+    ]
+    source = {"sourceDocument": document_name, "documentId": document_id}
+    return _batch_commands(KEY_PROVISIONS_QUERY, source, "provisions", provision_rows)
 
 
 def generate_financials_cypher(financials: List[Dict[str, Any]],
                              document_name: str,
-                             document_id: str) -> List[str]:
+                             document_id: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for financial mentions.
     
     Args:
@@ -275,40 +339,19 @@ def generate_financials_cypher(financials: List[Dict[str, Any]],
         document_id: Identifier of the source document
         
     Returns:
-        List of Cypher commands for financial mentions
+        List of (query, parameters) pairs for financial mentions
     """
-    cypher_commands = []
-    
-    # Find the contract node reference
-    contract_ref = "(c:Contract {documentId: '" + document_id + "'})"
-    
-    for idx, financial in enumerate(financials):
-        # Clean text for Cypher query
-        amount = financial.get("amount", "").replace("'", "\\'")
-        context = financial.get("context", "").replace("'", "\\'")
-        
-        # Create a unique ID for the financial node
-        financial_id = f"f{idx}"
-        
-        # Create financial node
-        financial_cypher = (
-            f"CREATE ({financial_id}:Financial {{amount: '{amount}', "
-            f"context: '{context}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(financial_cypher)
-        
-        # Link to contract
-        rel_cypher = f"MATCH {contract_ref} CREATE (c)-[:HAS_FINANCIAL]->({financial_id})"
-        cypher_commands.append(rel_cypher)
-    
-    return cypher_commands
+    financial_rows = [
+        {"amount": financial.get("amount", ""), "context": financial.get("context", "")}
+        for financial in financials
+    ]
+    source = {"sourceDocument": document_name, "documentId": document_id}
+    return _batch_commands(FINANCIALS_QUERY, source, "financials", financial_rows)
 
 
 def generate_dates_cypher(dates: List[Dict[str, Any]],
                         document_name: str,
-                        document_id: str) -> List[str]:
+                        document_id: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for date mentions.
     
     Args:
@@ -317,40 +360,19 @@ def generate_dates_cypher(dates: List[Dict[str, Any]],
         document_id: Identifier of the source document
         
     Returns:
-        List of Cypher commands for date mentions
+        List of (query, parameters) pairs for date mentions
     """
-    cypher_commands = []
-    
-    # Find the contract node reference
-    contract_ref = "(c:Contract {documentId: '" + document_id + "'})"
-    
-    for idx, date in enumerate(dates):
-        # Clean text for Cypher query
-        date_value = date.get("date", "").replace("'", "\\'")
-        context = date.get("context", "").replace("'", "\\'")
-        
-        # Create a unique ID for the date node
-        date_id = f"d{idx}"
-        
-        # Create date node
-        date_cypher = (
-            f"CREATE ({date_id}:Date {{value: '{date_value}', "
-            f"context: '{context}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(date_cypher)
-        
-        # Link to contract
-        rel_cypher = f"MATCH {contract_ref} CREATE (c)-[:HAS_DATE]->({date_id})"
-        cypher_commands.append(rel_cypher)
-    
-    return cypher_commands
+    date_rows = [
+        {"value": date.get("date", ""), "context": date.get("context", "")}
+        for date in dates
+    ]
+    source = {"sourceDocument": document_name, "documentId": document_id}
+    return _batch_commands(DATES_QUERY, source, "dates", date_rows)
 
 
 def generate_terms_cypher(terms: Dict[str, List[str]],
                         document_name: str,
-                        document_id: str) -> List[str]:
+                        document_id: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for key legal terms.
     
     Args:
@@ -359,45 +381,20 @@ def generate_terms_cypher(terms: Dict[str, List[str]],
         document_id: Identifier of the source document
         
     Returns:
-        List of Cypher commands for key legal terms
+        List of (query, parameters) pairs for key legal terms
     """
-    cypher_commands = []
-    
-    # Find the contract node reference
-    contract_ref = "(c:Contract {documentId: '" + document_id + "'})"
-    
-    for term_name, contexts in terms.items():
-        # Clean text for Cypher query
-        term_name_clean = term_name.replace("'", "\\'")
-        
-        # Create a sanitized term ID for the node
-        term_id = f"t_{term_name.lower().replace(' ', '_')}"
-        
-        # Create term node with bullet-point formatted contexts
-        contexts_clean = []
-        for context in contexts:
-            contexts_clean.append(context.replace("'", "\\'"))
-        
-        bullet_points = "• " + "\n• ".join(contexts_clean)
-        
-        term_cypher = (
-            f"CREATE ({term_id}:Term {{name: '{term_name_clean}', "
-            f"contexts: '{bullet_points}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(term_cypher)
-        
-        # Link to contract
-        rel_cypher = f"MATCH {contract_ref} CREATE (c)-[:HAS_TERM]->({term_id})"
-        cypher_commands.append(rel_cypher)
-    
-    return cypher_commands
+    # Each term's contexts are stored as a bullet-point formatted string
+    term_rows = [
+        {"name": term_name, "contexts": bullet_list(contexts)}
+        for term_name, contexts in terms.items()
+    ]
+    source = {"sourceDocument": document_name, "documentId": document_id}
+    return _batch_commands(TERMS_QUERY, source, "terms", term_rows)
 
 
 def generate_entities_cypher(entities: Dict[str, List[str]],
                            document_name: str,
-                           document_id: str) -> List[str]:
+                           document_id: str) -> List[Tuple[str, Dict[str, Any]]]:
     """Generate Cypher commands for named entities.
     
     Args:
@@ -406,37 +403,12 @@ def generate_entities_cypher(entities: Dict[str, List[str]],
         document_id: Identifier of the source document
         
     Returns:
-        List of Cypher commands for named entities
+        List of (query, parameters) pairs for named entities
     """
-    cypher_commands = []
-    
-    # Find the contract node reference
-    contract_ref = "(c:Contract {documentId: '" + document_id + "'})"
-    
-    for entity_type, entity_list in entities.items():
-        # Clean entity type for Cypher query
-        entity_type_clean = entity_type.replace("'", "\\'")
-        
-        # Create a sanitized entity ID for the node
-        entity_id = f"e_{entity_type.lower()}"
-        
-        # Create entity values as bullet points
-        entity_values_clean = []
-        for entity in entity_list:
-            entity_values_clean.append(entity.replace("'", "\\'"))
-        
-        bullet_points = "• " + "\n• ".join(entity_values_clean)
-        
-        entity_cypher = (
-            f"CREATE ({entity_id}:Entity {{type: '{entity_type_clean}', "
-            f"values: '{bullet_points}', "
-            f"sourceDocument: '{document_name}', "
-            f"documentId: '{document_id}' }})"
-        )
-        cypher_commands.append(entity_cypher)
-        
-        # Link to contract
-        rel_cypher = f"MATCH {contract_ref} CREATE (c)-[:HAS_ENTITY]->({entity_id})"
-        cypher_commands.append(rel_cypher)
-    
-    return cypher_commands
\ No newline at end of file
+    # Each type's entity values are stored as a bullet-point formatted string
+    entity_rows = [
+        {"type": entity_type, "values": bullet_list(entity_list)}
+        for entity_type, entity_list in entities.items()
+    ]
+    source = {"sourceDocument": document_name, "documentId": document_id}
+    return _batch_commands(ENTITIES_QUERY, source, "entities", entity_rows)
\ No newline at end of file
@@ -6,262 +6,279 @@ This module handles extraction of articles and sections
 from the parsed contract JSON using advanced NLP techniques.
 """
 
-import re
+from operator import itemgetter
 from typing import Dict, List, Any
 
 from contract_constants import (
-    ROMAN_TO_NUMBER, ARTICLE_PATTERNS, SECTION_PATTERNS
+    ROMAN_TO_NUMBER, NUMERIC_IDS, ARTICLE_PATTERNS, ARTICLE_PATTERNS_IGNORECASE, SECTION_PATTERNS,
+    ARTICLE_HEADER_START_PATTERN, SECTION_HEADER_START_PATTERN, SECTION_ENTITY_START_PATTERN
 )
 
+# Number of text chunks per ContractBERT forward pass
+NER_BATCH_SIZE = 32
 
-def extract_articles(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[Dict[str, Any]]:
-    """Extract articles and sections using SpaCy and ContractBERT for better structure analysis."""
-    articles = []
+# Pipeline components that sentence boundaries depend on; everything else
+# (tagger, lemmatizer, NER, ...) is skipped while scanning for headers
+SENTENCE_PIPES = ("tok2vec", "parser", "senter", "sentencizer")
+
+
+def _iter_sentence_docs(nlp, texts: List[str], chunk_size: int):
+    """Yield (text index, chunk offset, doc) for every chunk of texts, all
+    batched through a single nlp.pipe call."""
+    chunks = [(index, start) for index, text in enumerate(texts) for start in range(0, len(text), chunk_size)]
+    disabled = [name for name in nlp.pipe_names if name not in SENTENCE_PIPES]
+    with nlp.select_pipes(disable=disabled):
+        docs = nlp.pipe((texts[index][start:start + chunk_size] for index, start in chunks), batch_size=8)
+        for (index, start), doc in zip(chunks, docs):
+            yield index, start, doc
+
+
+def _extract_document_articles(document: Dict[str, Any], nlp, contractbert_ner) -> List[Dict[str, Any]]:
+    """Extract the articles of a single LlamaParse document."""
+    document_articles = []
     
-    # Process all pages to extract structure
-    for document in data:
-        pages_text = []
-        for page in document["pages"]:
-            pages_text.append(page["text"])
-        
-        # Combine all text for better pattern matching across page breaks
-        full_text = "\n".join(pages_text)
-        
-        # Process in chunks to avoid memory issues with large documents
-        chunk_size = 10000
-        text_chunks = [full_text[i:i+chunk_size] for i in range(0, len(full_text), chunk_size)]
-        
-        # Use ContractBERT for structural entity recognition
-        print("Using ContractBERT to identify document structure...")
-        bert_chunk_size = 450  # Smaller for BERT models
-        bert_chunks = [full_text[i:i+bert_chunk_size] for i in range(0, min(len(full_text), 50000), bert_chunk_size)]
-        
-        # Variables to track document structural elements
-        structure_entities = []
-        
-        for i, chunk in enumerate(bert_chunks):
-            # Process each chunk with ContractBERT
-            results = contractbert_ner(chunk)
+    # Combine all text for better pattern matching across page breaks
+    full_text = "\n".join(page["text"] for page in document["pages"])
+    
+    # Use ContractBERT for structural entity recognition
+    print("Using ContractBERT to identify document structure...")
+    bert_chunk_size = 450  # Smaller for BERT models
+    bert_chunks = [full_text[i:i+bert_chunk_size] for i in range(0, min(len(full_text), 50000), bert_chunk_size)]
+    
+    # Variables to track document structural elements
+    structure_entities = []
+    
+    # Process all chunks with ContractBERT in one batched call; it returns
+    # one list of entities per chunk
+    batch_results = contractbert_ner(bert_chunks, batch_size=NER_BATCH_SIZE) if bert_chunks else []
+    
+    for i, results in enumerate(batch_results):
+        for entity in results:
+            # Look for article and section headers
+            word = entity.get("word", "")
+            entity_group = entity.get("entity_group", "")
             
-            for entity in results:
-                # Look for article and section headers
-                word = entity.get("word", "")
-                entity_group = entity.get("entity_group", "")
+            # Identify potential article headers by label or patterns
+            if (entity_group in ["ORG", "LAW"] and 
+                ("ARTICLE" in word.upper() or 
+                 any(pattern.match(word) for pattern in ARTICLE_PATTERNS_IGNORECASE))):
                 
-                # Identify potential article headers by label or patterns
-                if (entity_group in ["ORG", "LAW"] and 
-                    ("ARTICLE" in word.upper() or 
-                     any(re.match(pattern, word, re.IGNORECASE) for pattern in ARTICLE_PATTERNS))):
+                # Remember where the entity sits in the full text; the
+                # decoded word is normalized by the tokenizer (lowercased,
+                # spaced punctuation), so only its span locates the header
+                start = i * bert_chunk_size + entity.get("start", 0)
+                end = i * bert_chunk_size + entity.get("end", entity.get("start", 0) + len(word))
+                structure_entities.append({"type": "article", "text": word, "start": start, "end": end})
+    
+    # Process identified structural entities
+    for idx, entity in enumerate(structure_entities):
+        if entity["type"] == "article":
+            # Extract article number and title using regex
+            for pattern in ARTICLE_PATTERNS_IGNORECASE:
+                match = pattern.search(entity["text"])
+                if match:
+                    article_num = match.group(1)
+                    article_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
                     
-                    structure_entities.append({"type": "article", "text": word, "chunk_idx": i})
-        
-        # Process identified structural entities
-        for idx, entity in enumerate(structure_entities):
-            if entity["type"] == "article":
-                # Extract article number and title using regex
-                for pattern in ARTICLE_PATTERNS:
-                    match = re.search(pattern, entity["text"], re.IGNORECASE)
-                    if match:
-                        article_num = match.group(1)
-                        article_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
-                        
-                        # Convert Roman numerals to numeric if needed
-                        numeric_id = ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
-                        
-                        new_article = {
-                            "number": article_num,
-                            "numeric_id": numeric_id,
-                            "title": article_title,
-                            "content": "",
-                            "sections": []
-                        }
-                        articles.append(new_article)
-                        break
-        
-        # If no articles identified through ContractBERT, use SpaCy's linguistic features
-        if not articles:
-            print("Using SpaCy's linguistic features to identify document structure...")
-            for i, chunk in enumerate(text_chunks):
-                doc = nlp(chunk)
-                
-                # Look for sentence patterns that could be article headers
-                for sent in doc.sents:
-                    # Check for potential headers using linguistic features
-                    if (sent.text.isupper() or 
-                        re.match(r"ARTICLE|Article|Section|\d+\.\s*[A-Z]", sent.text)):
-                        
-                        # Extract potential article number and title
-                        for pattern in ARTICLE_PATTERNS:
-                            match = re.search(pattern, sent.text)
-                            if match:
-                                article_num = match.group(1)
-                                article_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
-                                
-                                # Convert Roman numerals to numeric if needed
-                                numeric_id = ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
-                                
-                                new_article = {
-                                    "number": article_num,
-                                    "numeric_id": numeric_id,
-                                    "title": article_title,
-                                    "content": "",
-                                    "sections": []
-                                }
-                                articles.append(new_article)
-                                break
-                        
-                    # If no specific pattern match but sentence looks like a header
-                    if not articles and sent.text.isupper() and len(sent.text.split()) < 8:
-                        articles.append({
-                            "number": str(len(articles) + 1), 
-                            "numeric_id": str(len(articles) + 1), 
-                            "title": sent.text.strip(),
-                            "content": "",
-                            "sections": []
-                        })
-        
-        # Sort articles to ensure proper order
-        if articles:
-            try:
-                articles.sort(key=lambda x: int(x["numeric_id"]))
-            except (ValueError, TypeError):
-                # If conversion fails, maintain the original order
-                pass
-        
-        # Extract sections within articles
-        for idx, article in enumerate(articles):
-            # Find the article's position in the text
-            article_pattern = f"ARTICLE\\s+{re.escape(article['number'])}|Article\\s+{re.escape(article['number'])}"
-            if article['title']:
-                article_pattern += f"|{re.escape(article['title'])}"
-            
-            article_start_idx = -1
-            for match in re.finditer(article_pattern, full_text, re.IGNORECASE):
-                article_start_idx = match.start()
-                break
-            
-            # If we can't find the article, use a rough position based on the articles array
-            if article_start_idx == -1:
-                if idx == 0:
-                    article_start_idx = 0
-                else:
-                    prev_art_title = articles[idx-1]['title']
-                    article_start_idx = full_text.find(prev_art_title)
-                    if article_start_idx > 0:
-                        article_start_idx += len(prev_art_title)
-            
-            # Determine article end
-            article_end_idx = len(full_text)
-            if idx < len(articles) - 1:
-                next_art_title = articles[idx+1]['title']
-                next_art_pattern = f"ARTICLE\\s+{re.escape(articles[idx+1]['number'])}|Article\\s+{re.escape(articles[idx+1]['number'])}|{re.escape(next_art_title)}"
-                
-                next_match = re.search(next_art_pattern, full_text[article_start_idx:], re.IGNORECASE)
-                if next_match:
-                    article_end_idx = article_start_idx + next_match.start()
+                    # Convert Roman numerals to numeric if needed
+                    numeric_id = NUMERIC_IDS.get(article_num) or ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
+                    
+                    new_article = {
+                        "number": article_num,
+                        "numeric_id": numeric_id,
+                        "title": article_title,
+                        "content": "",
+                        "sections": [],
+                        "_start": entity["start"],
+                        "_header_end": entity["end"]
+                    }
+                    document_articles.append(new_article)
+                    break
+    
+    # If no articles identified through ContractBERT, use SpaCy's linguistic features
+    if not document_articles:
+        print("Using SpaCy's linguistic features to identify document structure...")
+        # Process in chunks to avoid memory issues with large documents;
+        # each chunk is sliced only when it is about to be parsed
+        chunk_size = 10000
+        for _, chunk_start, doc in _iter_sentence_docs(nlp, [full_text], chunk_size):
             
-            # Extract article text
-            if article_start_idx >= 0:
-                article_text = full_text[article_start_idx:article_end_idx]
-                
-                # Use NLP for section identification
-                section_chunks = []
+            # Look for sentence patterns that could be article headers
+            for sent in doc.sents:
+                sent_start = chunk_start + sent.start_char
                 
-                # Divide article into manageable chunks for NLP processing
-                article_chunk_size = min(len(article_text), 10000)
-                article_chunks = [article_text[i:i+article_chunk_size] for i in range(0, len(article_text), article_chunk_size)]
-                
-                for chunk in article_chunks:
-                    doc = nlp(chunk)
+                # Check for potential headers using linguistic features
+                if (sent.text.isupper() or 
+                    ARTICLE_HEADER_START_PATTERN.match(sent.text)):
                     
-                    # Use linguistic features to identify potential section headers
-                    for sent in doc.sents:
-                        # Look for patterns that suggest a section header
-                        if (re.match(r"^\d+\.\d+\s+[A-Z]", sent.text) or  # Like "1.2 Section Title"
-                            re.match(r"^[a-z]\)\s+[A-Z]", sent.text)):     # Like "a) Section Title"
+                    # Extract potential article number and title
+                    for pattern in ARTICLE_PATTERNS:
+                        match = pattern.search(sent.text)
+                        if match:
+                            article_num = match.group(1)
+                            article_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
                             
-                            section_chunks.append(sent.text)
-                
-                # Process potential section headers
-                for section_text in section_chunks:
-                    for pattern in SECTION_PATTERNS:
-                        match = re.search(pattern, section_text)
-                        if match and len(match.groups()) >= 2:
-                            section_num = match.group(1)
-                            section_title = match.group(2).strip()
+                            # Convert Roman numerals to numeric if needed
+                            numeric_id = NUMERIC_IDS.get(article_num) or ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
                             
-                            # Add section to the article
-                            section = {
-                                "number": section_num,
-                                "title": section_title,
-                                "content": ""
+                            new_article = {
+                                "number": article_num,
+                                "numeric_id": numeric_id,
+                                "title": article_title,
+                                "content": "",
+                                "sections": [],
+                                "_start": sent_start + match.start(),
+                                "_header_end": sent_start + match.end()
                             }
-                            article["sections"].append(section)
+                            document_articles.append(new_article)
                             break
                 
-                # If NLP approach didn't find sections, use ContractBERT
-                if not article["sections"]:
-                    # Process article text with ContractBERT
-                    bert_art_chunks = [article_text[i:i+bert_chunk_size] for i in range(0, min(len(article_text), 20000), bert_chunk_size)]
-                    
-                    for chunk in bert_art_chunks:
-                        results = contractbert_ner(chunk)
-                        
-                        for entity in results:
-                            word = entity.get("word", "")
-                            
-                            # Check if this looks like a section header
-                            if re.match(r"\d+\.\d+\s+\w+|\([a-z]\)\s+\w+", word):
-                                for pattern in SECTION_PATTERNS:
-                                    match = re.search(pattern, word)
-                                    if match and len(match.groups()) >= 2:
-                                        section_num = match.group(1)
-                                        section_title = match.group(2).strip()
-                                        
-                                        # Add section to article
-                                        section = {
-                                            "number": section_num,
-                                            "title": section_title,
-                                            "content": ""
-                                        }
-                                        
-                                        # Check for duplicates
-                                        if not any(s["number"] == section_num for s in article["sections"]):
-                                            article["sections"].append(section)
+                # If no specific pattern match but sentence looks like a header
+                if not document_articles and sent.text.isupper() and len(sent.text.split()) < 8:
+                    document_articles.append({
+                        "number": str(len(document_articles) + 1),
+                        "numeric_id": str(len(document_articles) + 1),
+                        "title": sent.text.strip(),
+                        "content": "",
+                        "sections": [],
+                        "_start": sent_start,
+                        "_header_end": sent_start + len(sent.text)
+                    })
+    
+    # Drop headers that start inside an earlier header: the same header
+    # picked up twice by overlapping entities or patterns
+    by_position = []
+    for article in sorted(document_articles, key=lambda x: x["_start"]):
+        if by_position and article["_start"] < by_position[-1]["_header_end"]:
+            continue
+        by_position.append(article)
+    document_articles = list(by_position)
+    
+    # Each article runs from its header to the next header in text order
+    for idx, article in enumerate(by_position):
+        if idx < len(by_position) - 1:
+            article["_end"] = by_position[idx + 1]["_start"]
+        else:
+            article["_end"] = len(full_text)
+    
+    # Sort articles to ensure proper order; the integer key is parsed once
+    # per article up front
+    if document_articles:
+        try:
+            for article in document_articles:
+                article["_order"] = int(article["numeric_id"])
+        except (ValueError, TypeError):
+            # If conversion fails, maintain the original order
+            pass
+        else:
+            document_articles.sort(key=itemgetter("_order"))
+    
+    # Use NLP for section identification. Every article's text is divided
+    # into manageable chunks and all of them go through one nlp.pipe pass;
+    # each candidate keeps its offset within its article's text so
+    # boundaries need no re-search
+    article_texts = [full_text[article["_start"]:article["_end"]] for article in document_articles]
+    section_candidates = [[] for _ in document_articles]
+    article_chunk_size = 10000
+    for article_idx, chunk_start, doc in _iter_sentence_docs(nlp, article_texts, article_chunk_size):
+        
+        # Use linguistic features to identify potential section headers
+        for sent in doc.sents:
+            # Look for patterns that suggest a section header, like
+            # "1.2 Section Title" or "a) Section Title"
+            if SECTION_HEADER_START_PATTERN.match(sent.text):
                 
-                # Extract content for each section
-                for i, section in enumerate(article["sections"]):
-                    section_pattern = f"{re.escape(section['number'])}\\s+{re.escape(section['title'])}"
-                    section_match = re.search(section_pattern, article_text)
-                    
-                    if not section_match:
-                        continue
-                        
-                    section_start = section_match.end()
-                    
-                    # Find end of this section (start of next section or end of article)
-                    section_end = len(article_text)
-                    if i < len(article["sections"]) - 1:
-                        next_sec = article["sections"][i+1]
-                        next_pattern = f"{re.escape(next_sec['number'])}\\s+{re.escape(next_sec['title'])}"
-                        next_match = re.search(next_pattern, article_text[section_start:])
-                        if next_match:
-                            section_end = section_start + next_match.start()
+                section_candidates[article_idx].append((sent.text, chunk_start + sent.start_char))
+    
+    # Extract sections within articles
+    for article, article_text, section_chunks in zip(document_articles, article_texts, section_candidates):
+        # Process potential section headers
+        for section_text, offset in section_chunks:
+            for pattern in SECTION_PATTERNS:
+                match = pattern.search(section_text)
+                if match and len(match.groups()) >= 2:
+                    section_num = match.group(1)
+                    section_title = match.group(2).strip()
                     
-                    # Store section content
-                    section_content = article_text[section_start:section_end].strip()
-                    section["content"] = section_content
-                
-                # If no sections were found, store the entire article text as content
-                if not article["sections"]:
-                    # Remove the article header from the content
-                    content_start = 0
-                    for pattern in ARTICLE_PATTERNS:
-                        header_match = re.search(pattern, article_text)
-                        if header_match:
-                            content_start = header_match.end()
-                            break
+                    # Add section to the article
+                    section = {
+                        "number": section_num,
+                        "title": section_title,
+                        "content": "",
+                        "_start": offset + match.start(),
+                        "_header_end": offset + match.end()
+                    }
+                    article["sections"].append(section)
+                    break
+        
+        # If NLP approach didn't find sections, use ContractBERT
+        if not article["sections"]:
+            # Process article text with ContractBERT
+            bert_art_chunks = [article_text[i:i+bert_chunk_size] for i in range(0, min(len(article_text), 20000), bert_chunk_size)]
+            
+            art_results = contractbert_ner(bert_art_chunks, batch_size=NER_BATCH_SIZE) if bert_art_chunks else []
+            
+            for j, results in enumerate(art_results):
+                for entity in results:
+                    word = entity.get("word", "")
                     
-                    article["content"] = article_text[content_start:].strip()
+                    # Check if this looks like a section header
+                    if SECTION_ENTITY_START_PATTERN.match(word):
+                        # Header span in the article text, from the entity
+                        # rather than from the normalized word
+                        offset = j * bert_chunk_size + entity.get("start", 0)
+                        offset_end = j * bert_chunk_size + entity.get("end", entity.get("start", 0) + len(word))
+                        for pattern in SECTION_PATTERNS:
+                            match = pattern.search(word)
+                            if match and len(match.groups()) >= 2:
+                                section_num = match.group(1)
+                                section_title = match.group(2).strip()
+                                
+                                # Add section to article
+                                section = {
+                                    "number": section_num,
+                                    "title": section_title,
+                                    "content": "",
+                                    "_start": offset,
+                                    "_header_end": offset_end
+                                }
+                                
+                                # Check for duplicates
+                                if not any(s["number"] == section_num for s in article["sections"]):
+                                    article["sections"].append(section)
+        
+        # Extract content for each section: from the end of its header
+        # to the start of the next section header (or end of article)
+        sections = sorted(article["sections"], key=lambda x: x["_start"])
+        for i, section in enumerate(sections):
+            section_end = len(article_text)
+            if i < len(sections) - 1:
+                section_end = sections[i + 1]["_start"]
+            
+            # Store section content
+            section["content"] = article_text[section["_header_end"]:section_end].strip()
+        
+        # If no sections were found, store the article text after its header as content
+        if not article["sections"]:
+            article["content"] = full_text[article["_header_end"]:article["_end"]].strip()
+    
+    # Drop the internal position bookkeeping before handing results back
+    for article in document_articles:
+        for key in ("_start", "_header_end", "_end", "_order"):
+            article.pop(key, None)
+        for section in article["sections"]:
+            section.pop("_start", None)
+            section.pop("_header_end", None)
+    
+    return document_articles
+
+
+def extract_articles(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[Dict[str, Any]]:
+    """Extract articles and sections using SpaCy and ContractBERT for better structure analysis."""
+    articles = []
+    
+    # Process all pages to extract structure; documents are independent
+    for document in data:
+        articles.extend(_extract_document_articles(document, nlp, contractbert_ner))
     
-    return articles
\ No newline at end of file
+    return articles
@@ -6,13 +6,26 @@ This module handles extraction of contract metadata like titles, dates,
 document types, and parties from the parsed contract JSON using advanced NLP techniques.
 """
 
-import re
 from typing import Dict, List, Any
 
 from contract_constants import (
-    TITLE_PATTERNS, DOC_TYPES, DATE_CONTEXTS, PARTY_INDICATORS, DATE_PATTERNS
+    TITLE_PATTERNS, DOC_TYPE_LABEL_PATTERNS, DATE_CONTEXTS, PARTY_INDICATORS, DATE_PATTERNS,
+    PARTY_MARKER_PATTERN, BETWEEN_PARTIES_PATTERN,
+    EFFECTIVE_DATE_PATTERN, MONTH_DAY_YEAR_PATTERN, DATE_PUNCTUATION_PATTERN
 )
 
+# Number of text chunks per ContractBERT forward pass
+NER_BATCH_SIZE = 32
+
+# spaCy components needed for sentence boundaries and for entity spans; the
+# rest of the pipeline is switched off for those passes
+SENTENCE_PIPES = ("tok2vec", "parser", "senter", "sentencizer")
+NER_PIPES = ("tok2vec", "ner")
+
+# How far into the first page the regex title fallback looks; the cut is
+# moved to the next line break so no title line is split
+TITLE_SCAN_CHARS = 800
+
 
 def extract_contract_metadata(data: List[Dict[str, Any]], nlp, 
                              contractbert_ner, contractbert_classifier) -> Dict[str, Any]:
@@ -24,7 +37,7 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
         first_page_text = data[0]["pages"][0]["text"]
         
         # First, try a direct pattern match for "Effective Date: <date>" format
-        effective_date_match = re.search(r"Effective\s+Date:\s*([A-Za-z]+\s+\d{1,2},\s*\d{4})", first_page_text)
+        effective_date_match = EFFECTIVE_DATE_PATTERN.search(first_page_text)
         if effective_date_match:
             metadata["effective_date"] = effective_date_match.group(1).strip()
         
@@ -33,8 +46,9 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
         # Prepare text for classification (first 1000 chars is usually sufficient)
         classification_text = first_page_text[:1000]
         
-        # Apply the classifier
-        doc_classification = contractbert_classifier(classification_text)
+        # Apply the classifier; a blank page has nothing to classify, so
+        # the transformer call is skipped for it
+        doc_classification = contractbert_classifier(classification_text) if classification_text.strip() else []
         
         if doc_classification and len(doc_classification) > 0:
             label = doc_classification[0].get("label", "")
@@ -67,10 +81,11 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
         # Extract entities using ContractBERT
         entities = {"DATE": [], "ORG": [], "PERSON": [], "MONEY": [], "TIME": [], "LOC": []}
         
-        for chunk in text_chunks:
-            # Apply NER pipeline to each chunk
-            results = contractbert_ner(chunk)
-            
+        # Apply the NER pipeline to all chunks in one batched call; it returns
+        # one list of entities per chunk
+        batch_results = contractbert_ner(text_chunks, batch_size=NER_BATCH_SIZE) if text_chunks else []
+        
+        for results in batch_results:
             # Group results by entity type
             for entity in results:
                 entity_type = entity.get("entity_group", "")
@@ -94,16 +109,18 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
             
             # Then, try to find additional dates using regex patterns
             for pattern in DATE_PATTERNS:
-                for match in re.finditer(pattern, first_page_text):
+                for match in pattern.finditer(first_page_text):
                     date_str = match.group(0)
                     if date_str not in all_potential_dates:
                         all_potential_dates.append(date_str)
             
             # Look for effective date by proximity to context words
             found_effective_date = False
+            # Normalize the text by removing punctuation for comparison, and
+            # locate every candidate date in it once up front
+            normalized_text = DATE_PUNCTUATION_PATTERN.sub(' ', first_page_text.lower())
+            date_positions = [(date, normalized_text.find(date.lower())) for date in all_potential_dates]
             for context in DATE_CONTEXTS:
-                # Normalize the text by removing punctuation for comparison
-                normalized_text = re.sub(r'[.:,;]', ' ', first_page_text.lower())
                 context_pos = normalized_text.find(context)
                 
                 if context_pos >= 0:
@@ -111,10 +128,7 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
                     closest_date = None
                     min_distance = float('inf')
                     
-                    for date in all_potential_dates:
-                        date_lower = date.lower()
-                        date_pos = normalized_text.find(date_lower)
-                        
+                    for date, date_pos in date_positions:
                         # Only consider dates that appear after the context within a reasonable distance
                         if date_pos > context_pos and date_pos - context_pos < 100:
                             distance = date_pos - context_pos
@@ -130,7 +144,7 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
             # If no effective date found through context, try dates with specific formatting
             if not found_effective_date:
                 # Look for properly formatted dates (Month DD, YYYY)
-                month_day_year = re.search(r"([A-Z][a-z]+\s+\d{1,2},\s*\d{4})", first_page_text)
+                month_day_year = MONTH_DAY_YEAR_PATTERN.search(first_page_text)
                 if month_day_year:
                     metadata["effective_date"] = month_day_year.group(1)
                 # If still not found, use the first date from ContractBERT's identified dates
@@ -143,35 +157,37 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
         
         # Filter organizations that look like valid parties
         for org in org_entities:
-            if (len(org.split()) > 1 and  # Multi-word names are more likely to be organizations
-                (re.search(r"(?:Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|B\.V\.|GmbH)", org) or 
-                 any(term in org.lower() for term in ["company", "corporation", "technologies", "systems"]))):
+            if (len(org.split(None, 1)) > 1 and  # Multi-word names are more likely to be organizations
+                PARTY_MARKER_PATTERN.search(org)):
                 potential_parties.append(org)
         
-        # Remove duplicates and false positives
-        filtered_parties = []
-        for party in potential_parties:
-            # Skip common false positives
-            if any(term in party.lower() for term in ["article", "section", "this agreement", "hereinafter"]):
-                continue
-                
-            is_unique = True
-            for existing_party in filtered_parties:
-                if party in existing_party or existing_party in party:
-                    is_unique = False
-                    if len(party) > len(existing_party):
-                        filtered_parties.remove(existing_party)
-                        filtered_parties.append(party)
-                    break
-            if is_unique:
-                filtered_parties.append(party)
+        # Remove duplicates and false positives; exact repeats are collapsed
+        # up front so the containment checks only compare distinct names
+        candidates = []
+        for party in dict.fromkeys(potential_parties):
+            # Skip common false positives; the name is lowercased once for
+            # all the checks
+            party_lower = party.lower()
+            if not any(term in party_lower for term in ["article", "section", "this agreement", "hereinafter"]):
+                candidates.append(party)
+        
+        # Keep the longest form of each name: longer names are accepted
+        # first, so a candidate only needs checking against accepted names
+        kept = []
+        for party in sorted(candidates, key=len, reverse=True):
+            if not any(party in existing_party for existing_party in kept):
+                kept.append(party)
+        kept = set(kept)
+        filtered_parties = [party for party in candidates if party in kept]
         
         metadata["parties"] = filtered_parties[:5]  # Limit to 5 most likely parties
         
         # Use SpaCy for title extraction and additional entity analysis
         print("Using SpaCy for document analysis...")
         # Process text with SpaCy, limiting to manageable chunks
-        doc = nlp(first_page_text[:min(len(first_page_text), 15000)])
+        # (only sentence boundaries are used from this doc)
+        with nlp.select_pipes(disable=[name for name in nlp.pipe_names if name not in SENTENCE_PIPES]):
+            doc = nlp(first_page_text[:15000])
         
         # Extract title if not found by ContractBERT
         if not metadata["title"]:
@@ -193,8 +209,12 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
                 metadata["title"] = best_title
             # If no title found through NLP, try regex patterns
             else:
+                # Titles sit at the top of the first page, so only the
+                # leading lines are searched
+                title_head_end = first_page_text.find("\n", TITLE_SCAN_CHARS)
+                title_head = first_page_text if title_head_end < 0 else first_page_text[:title_head_end]
                 for pattern in TITLE_PATTERNS:
-                    title_match = re.search(pattern, first_page_text, re.IGNORECASE | re.MULTILINE)
+                    title_match = pattern.search(title_head)
                     if title_match:
                         potential_title = title_match.group(1).strip()
                         if len(potential_title.split()) <= 15:
@@ -204,29 +224,30 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
         # Get additional party information if needed
         if not metadata["parties"]:
             # Get between/and structure parties
-            between_match = re.search(r"Between\s+(.+?)\s+and\s+(.+?)(?=\s+(?:Effective Date|WITNESSETH|WHEREAS|NOW, THEREFORE|$))",
-                                     first_page_text, re.IGNORECASE | re.DOTALL)
+            between_match = BETWEEN_PARTIES_PATTERN.search(first_page_text)
             
             if between_match:
                 party1_text = between_match.group(1).strip()
                 party2_text = between_match.group(2).strip()
                 
-                # Process each party text with SpaCy
-                for party_text in [party1_text, party2_text]:
-                    party_doc = nlp(party_text)
-                    
+                # Process both party texts with SpaCy in one batch
+                party_texts = [party1_text, party2_text]
+                with nlp.select_pipes(disable=[name for name in nlp.pipe_names if name not in NER_PIPES]):
+                    party_docs = list(nlp.pipe(party_texts))
+                
+                for party_text, party_doc in zip(party_texts, party_docs):
                     # Look for organization entities
                     org_ents = [ent.text for ent in party_doc.ents if ent.label_ == "ORG"]
                     
                     if org_ents:
                         for org in org_ents:
-                            if len(org.split()) > 1 and len(org) > 5:
+                            if len(org) > 5 and len(org.split(None, 1)) > 1:
                                 # Determine entity type
                                 entity_type = "Organization"
                                 
                                 # Check against organization type patterns
-                                for pattern, type_name in DOC_TYPES.items():
-                                    if re.search(pattern, org):
+                                for pattern, type_name in DOC_TYPE_LABEL_PATTERNS:
+                                    if pattern.search(org):
                                         entity_type = type_name
                                         break
                                 
@@ -236,7 +257,7 @@ def extract_contract_metadata(data: List[Dict[str, Any]], nlp,
                                 })
                     else:
                         # If no organization entity found, use the entire party text
-                        if len(party_text.split()) > 1 and len(party_text) > 5:
+                        if len(party_text) > 5 and len(party_text.split(None, 1)) > 1:
                             metadata["parties"].append({
                                 "name": party_text.strip(),
                                 "type": "Organization"
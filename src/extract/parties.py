@@ -6,13 +6,30 @@ This module handles extraction of party information and signatories
 from the parsed contract JSON using advanced NLP techniques.
 """
 
-import re
+from collections import defaultdict
 from typing import Dict, List, Any
 
 from contract_constants import (
-    ENTITY_PATTERNS, ORG_TYPES, SIGNATURE_PATTERNS
+    ENTITY_PATTERNS, ORG_TYPES, SIGNATURE_UNION, SIGNATURE_UNION_GROUPS, LEGAL_SUFFIX_PATTERN,
+    CORPORATE_KEYWORD_PATTERN, BETWEEN_PARTIES_PATTERN, WHITESPACE_RUN_PATTERN
 )
 
+# Number of text chunks per ContractBERT forward pass
+NER_BATCH_SIZE = 32
+
+# Number of text chunks per spaCy nlp.pipe batch
+SPACY_BATCH_SIZE = 64
+
+# Pipeline components each pass actually needs: entity spans only need the
+# NER, noun chunks also need POS tags and the dependency parse
+NER_PIPES = ("tok2vec", "ner")
+NOUN_CHUNK_PIPES = NER_PIPES + ("tagger", "attribute_ruler", "parser")
+
+
+def _pipes_except(nlp, keep) -> List[str]:
+    """Names of the pipeline components to disable so only `keep` runs."""
+    return [name for name in nlp.pipe_names if name not in keep]
+
 
 def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[Dict[str, Any]]:
     """Extract detailed information about the parties using ContractBERT and SpaCy NER."""
@@ -41,10 +58,11 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
     # Track identified organizations and persons
     bert_entities = {"ORG": [], "PERSON": []}
     
-    for chunk in first_pages_chunks:
-        # Process chunk with ContractBERT
-        results = contractbert_ner(chunk)
-        
+    # Process the chunks with ContractBERT in one batched call; it returns
+    # one list of entities per chunk
+    batch_results = contractbert_ner(first_pages_chunks, batch_size=NER_BATCH_SIZE) if first_pages_chunks else []
+    
+    for results in batch_results:
         # Extract entities by type
         for entity in results:
             entity_type = entity.get("entity_group", "")
@@ -54,28 +72,26 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
                     bert_entities[entity_type].append(word)
     
     # Filter out likely parties from the organizations
-    potential_parties = []
+    # Insertion-ordered set: repeated mentions of the same name collapse here,
+    # so membership tests and the uniqueness pass below stay cheap
+    potential_parties = {}
     
     # Process organization entities from ContractBERT
     for org in bert_entities["ORG"]:
         # Apply heuristics to identify legitimate party names
-        if (len(org.split()) > 1 and  # Multi-word names are more likely to be organizations
-            any(re.search(pattern, org) for pattern in [
-                r"Inc\.|LLC|Ltd\.|Limited|Corp\.|Corporation|B\.V\.|GmbH",
-                r"Company|Corporation|Technologies|Systems|International"
-            ])):
-            potential_parties.append(org)
+        if (len(org.split(None, 1)) > 1 and  # Multi-word names are more likely to be organizations
+            (LEGAL_SUFFIX_PATTERN.search(org) or CORPORATE_KEYWORD_PATTERN.search(org))):
+            potential_parties[org] = None
         
         # Check Organizations Near Party-Indicating Context
         if any(indicator in first_pages_text for indicator in [
             f"party", f"between.*{org}", f"{org}.*agrees", f"{org}.*hereinafter",
             f"{org}.*referred to"
         ]):
-            potential_parties.append(org)
+            potential_parties[org] = None
     
     # Look specifically near "Between" and "And" for parties
-    between_match = re.search(r"Between\s+(.+?)\s+and\s+(.+?)(?=\s+(?:Effective Date|WITNESSETH|WHEREAS|NOW, THEREFORE|$))",
-                             first_pages_text, re.IGNORECASE | re.DOTALL)
+    between_match = BETWEEN_PARTIES_PATTERN.search(first_pages_text)
     
     if between_match:
         party1_text = between_match.group(1).strip()
@@ -86,7 +102,7 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
             for org in bert_entities["ORG"]:
                 if org in party_text:
                     if org not in potential_parties:
-                        potential_parties.append(org)
+                        potential_parties[org] = None
     
     # Enhance with SpaCy NLP to find additional parties
     print("Enhancing party detection with SpaCy...")
@@ -95,59 +111,71 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
     spacy_chunk_size = 10000
     first_pages_chunks = [first_pages_text[i:i+spacy_chunk_size] for i in range(0, len(first_pages_text), spacy_chunk_size)]
     
-    for chunk in first_pages_chunks:
-        doc = nlp(chunk)
-        
+    with nlp.select_pipes(disable=_pipes_except(nlp, NOUN_CHUNK_PIPES)):
+        first_pages_docs = list(nlp.pipe(first_pages_chunks, batch_size=SPACY_BATCH_SIZE))
+    
+    for doc in first_pages_docs:
         # Extract organization entities
         for ent in doc.ents:
             if ent.label_ == "ORG" and len(ent.text) > 2:
                 org = ent.text.strip()
                 # Organizations are typically multiword and often include legal suffixes
-                if len(org.split()) > 1 and len(org) > 5:
+                if len(org) > 5 and len(org.split(None, 1)) > 1:
                     if org not in potential_parties:
-                        potential_parties.append(org)
+                        potential_parties[org] = None
         
         # Use noun chunks to find potential missed organizations
         for chunk in doc.noun_chunks:
-            # Check if noun chunk contains typical organization words
-            if any(org_word in chunk.text.lower() for org_word in [
+            # Check if noun chunk contains typical organization words; the
+            # span text is built and lowercased once for all the checks
+            chunk_text = chunk.text
+            chunk_lower = chunk_text.lower()
+            if any(org_word in chunk_lower for org_word in [
                 "inc", "corp", "llc", "ltd", "company", "corporation",
                 "technologies", "systems", "associates", "partners"
             ]):
-                org = chunk.text.strip()
-                if len(org.split()) > 1 and len(org) > 5 and org not in potential_parties:
-                    potential_parties.append(org)
+                org = chunk_text.strip()
+                if len(org) > 5 and len(org.split(None, 1)) > 1 and org not in potential_parties:
+                    potential_parties[org] = None
     
-    # Create party records for the most likely organizations
-    seen_parties = set()
+    # Normalize and screen the candidate names
+    candidates = {}
     for party_name in potential_parties:
         # Normalize party name (remove extra spaces, standardize quotes)
-        party_name = re.sub(r'\s+', ' ', party_name).strip()
+        party_name = WHITESPACE_RUN_PATTERN.sub(' ', party_name).strip()
         party_name = party_name.replace('"', '"').replace('"', '"')
         
         # Filter out likely false positives
-        if any(x in party_name.lower() for x in [
+        party_lower = party_name.lower()
+        if any(x in party_lower for x in [
             "article", "section", "agreement", "contract", "date", 
             "herein", "hereof", "hereto", "effective date"
         ]):
             continue
-            
-        # Avoid duplicates or very similar names
-        is_unique = True
-        for seen in seen_parties:
-            if party_name in seen or seen in party_name:
-                is_unique = False
-                break
-                
-        if is_unique and len(party_name) > 5:
-            seen_parties.add(party_name)
+        
+        if len(party_name) > 5:
+            candidates[party_name] = None
+    
+    # Avoid duplicates or very similar names by keeping the longest form:
+    # longer names are accepted first, so a candidate only needs checking
+    # against the accepted names that could contain it
+    accepted_parties = []
+    for party_name in sorted(candidates, key=len, reverse=True):
+        if not any(party_name in accepted for accepted in accepted_parties):
+            accepted_parties.append(party_name)
+    accepted_parties = set(accepted_parties)
+    
+    # Create party records for the most likely organizations, in the order
+    # they were found
+    for party_name in candidates:
+        if party_name in accepted_parties:
             
             # Determine entity type
             entity_type = "Organization"
             
             # Check against organization type patterns
             for pattern, type_name in ORG_TYPES:
-                if re.search(pattern, party_name):
+                if pattern.search(party_name):
                     entity_type = type_name
                     break
             
@@ -163,9 +191,9 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
     # Use ContractBERT for signature extraction
     sig_chunks = [last_pages_text[i:i+chunk_size] for i in range(0, min(len(last_pages_text), 5000), chunk_size)]
     
-    for chunk in sig_chunks:
-        results = contractbert_ner(chunk)
-        
+    sig_results = contractbert_ner(sig_chunks, batch_size=NER_BATCH_SIZE) if sig_chunks else []
+    
+    for results in sig_results:
         for entity in results:
             entity_type = entity.get("entity_group", "")
             word = entity.get("word", "").strip()
@@ -178,35 +206,47 @@ def extract_parties(data: List[Dict[str, Any]], nlp, contractbert_ner) -> List[D
     # Enhance with SpaCy
     sig_chunks = [last_pages_text[i:i+spacy_chunk_size] for i in range(0, len(last_pages_text), spacy_chunk_size)]
     
-    for chunk in sig_chunks:
-        doc = nlp(chunk)
+    with nlp.select_pipes(disable=_pipes_except(nlp, NER_PIPES)):
+        sig_docs = list(nlp.pipe(sig_chunks, batch_size=SPACY_BATCH_SIZE))
+    
+    for doc in sig_docs:
         for ent in doc.ents:
             if ent.label_ == "ORG" and ent.text not in signature_entities["organizations"]:
                 signature_entities["organizations"].append(ent.text)
             elif ent.label_ == "PERSON" and ent.text not in signature_entities["people"]:
                 signature_entities["people"].append(ent.text)
     
-    # Match signature patterns to extract signatories and their roles
-    for pattern in SIGNATURE_PATTERNS:
-        matches = re.finditer(pattern, last_pages_text, re.IGNORECASE | re.MULTILINE)
-        for match in matches:
-            if len(match.groups()) >= 3:
-                company_name = match.group(1).strip()
-                person_name = match.group(2).strip()
-                title = match.group(3).strip()
-                
-                # Find matching party
-                for party in parties:
-                    # Check if this signatory belongs to this party
-                    if company_name in party["name"] or party["name"] in company_name:
-                        party["signatories"].append({"name": person_name, "title": title})
-                        break
-    
-    # Use NLP to match people with organizations based on proximity
-    sig_doc = nlp(last_pages_text)
-    
-    org_spans = [ent for ent in sig_doc.ents if ent.label_ == "ORG"]
-    person_spans = [ent for ent in sig_doc.ents if ent.label_ == "PERSON"]
+    # Match signature patterns to extract signatories and their roles; all
+    # patterns are tried in one scan and the matching alternative tells
+    # which capture groups hold the company, person and title
+    for match in SIGNATURE_UNION.finditer(last_pages_text):
+        groups = SIGNATURE_UNION_GROUPS[match.lastgroup]
+        if len(groups) >= 3:
+            company_name = match.group(groups[0]).strip()
+            person_name = match.group(groups[1]).strip()
+            title = match.group(groups[2]).strip()
+            
+            # Find matching party
+            for party in parties:
+                # Check if this signatory belongs to this party
+                if company_name in party["name"] or party["name"] in company_name:
+                    party["signatories"].append({"name": person_name, "title": title})
+                    break
+    
+    # Use NLP to match people with organizations based on proximity; when the
+    # signature pages fit in one chunk that doc is already parsed
+    if len(sig_docs) == 1:
+        sig_doc = sig_docs[0]
+    else:
+        with nlp.select_pipes(disable=_pipes_except(nlp, NER_PIPES)):
+            sig_doc = nlp(last_pages_text)
+    
+    # Bin the entities by label in a single walk over doc.ents
+    spans_by_label = defaultdict(list)
+    for ent in sig_doc.ents:
+        spans_by_label[ent.label_].append(ent)
+    org_spans = spans_by_label["ORG"]
+    person_spans = spans_by_label["PERSON"]
     
     # Match people to nearby organizations
     for person in person_spans:
@@ -8,12 +8,52 @@ when JSON structure has issues or lacks certain key information.
 
 import re
 import os
-from typing import Dict, List, Any, Optional
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, NamedTuple
 
 from contract_constants import (
-    ARTICLE_PATTERNS, SECTION_PATTERNS, ROMAN_TO_NUMBER
+    ARTICLE_PATTERNS_IGNORECASE, SECTION_PATTERNS,
+    ROMAN_TO_NUMBER, NUMERIC_IDS, STRONG_TITLE_KEYWORD_PATTERN, TITLE_KEYWORD_PATTERN,
+    AGREEMENT_TYPE_PATTERN
 )
 
+
+class HeaderMatch(NamedTuple):
+    """Position of an article or section header found by the regex scan."""
+    number: str
+    title: str
+    start: int
+    end: int
+
+
+def _scan_headers(patterns, text: str) -> List[HeaderMatch]:
+    """Find the headers matched by patterns in text, in text order.
+    
+    Patterns are tried in list order, one finditer pass each. A match that
+    overlaps one kept from an earlier, more specific pattern is dropped, so
+    e.g. the single-letter section pattern cannot swallow a numbered header
+    that follows it. The scan stays on the stdlib engine: the patterns rely
+    on lookahead and lazy quantifiers, which a multi-pattern matcher like
+    Hyperscan cannot compile, and the capture groups are needed.
+    """
+    starts = []
+    kept = []
+    for pattern in patterns:
+        for match in pattern.finditer(text):
+            # Kept matches never overlap, so the neighbours at the insertion
+            # point are the only ones that can overlap this match
+            i = bisect_left(starts, match.start())
+            if i > 0 and kept[i - 1].end > match.start():
+                continue
+            if i < len(kept) and kept[i].start < match.end():
+                continue
+            number = match.group(1)
+            title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
+            starts.insert(i, match.start())
+            kept.insert(i, HeaderMatch(number, title, match.start(), match.end()))
+    return kept
+
+
 def read_txt_file(txt_file_path: str) -> str:
     """Read content from a text file."""
     if not os.path.exists(txt_file_path):
@@ -26,35 +66,22 @@ def extract_articles_from_text(text: str) -> List[Dict[str, Any]]:
     """Extract articles from plain text using regex patterns."""
     articles = []
     
-    # Find all article headers in the document
-    article_matches = []
-    for pattern in ARTICLE_PATTERNS:
-        for match in re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE):
-            article_num = match.group(1)
-            article_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
-            article_matches.append({
-                "number": article_num,
-                "title": article_title,
-                "start": match.start(),
-                "end": match.end()
-            })
-    
-    # Sort matches by their position in the text
-    article_matches.sort(key=lambda x: x["start"])
+    # Find all article headers in the document, in text order
+    article_matches = _scan_headers(ARTICLE_PATTERNS_IGNORECASE, text)
     
     # Process each article
     for i, match in enumerate(article_matches):
-        article_num = match["number"]
-        article_title = match["title"]
+        article_num = match.number
+        article_title = match.title
         
         # Convert Roman numerals to numeric if needed
-        numeric_id = ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
+        numeric_id = NUMERIC_IDS.get(article_num) or ROMAN_TO_NUMBER.get(article_num.upper(), article_num)
         
         # Determine where this article ends (start of next article or end of text)
-        article_start = match["end"]
+        article_start = match.end
         article_end = len(text)
         if i < len(article_matches) - 1:
-            article_end = article_matches[i + 1]["start"]
+            article_end = article_matches[i + 1].start
         
         # Extract article content
         article_content = text[article_start:article_end].strip()
@@ -77,31 +104,19 @@ def extract_articles_from_text(text: str) -> List[Dict[str, Any]]:
 
 def extract_sections_from_text(article: Dict[str, Any], article_text: str) -> None:
     """Extract sections from article text and add them to the article dictionary."""
-    section_matches = []
-    for pattern in SECTION_PATTERNS:
-        for match in re.finditer(pattern, article_text, re.MULTILINE):
-            section_num = match.group(1)
-            section_title = match.group(2).strip() if len(match.groups()) > 1 else "UNTITLED"
-            section_matches.append({
-                "number": section_num,
-                "title": section_title,
-                "start": match.start(),
-                "end": match.end()
-            })
-    
-    # Sort sections by their position in the text
-    section_matches.sort(key=lambda x: x["start"])
+    # Find all section headers in the article, in text order
+    section_matches = _scan_headers(SECTION_PATTERNS, article_text)
     
     # Process each section
     for i, match in enumerate(section_matches):
-        section_num = match["number"]
-        section_title = match["title"]
+        section_num = match.number
+        section_title = match.title
         
         # Determine section content boundaries
-        section_start = match["end"]
+        section_start = match.end
         section_end = len(article_text)
         if i < len(section_matches) - 1:
-            section_end = section_matches[i + 1]["start"]
+            section_end = section_matches[i + 1].start
         
         # Extract section content
         section_content = article_text[section_start:section_end].strip()
@@ -139,36 +154,40 @@ def extract_contract_metadata_from_text(text: str) -> Dict[str, Any]:
     non_empty_lines = [line.strip() for line in lines if line.strip()]
     
     # Extract title using multiple techniques for robustness
-    potential_titles = []
-    
-    # Method 1: Look for ALL CAPS lines that could be titles
-    if non_empty_lines:
-        for i, line in enumerate(non_empty_lines[:10]):  # Check first 10 non-empty lines
+    # Method 1 (first 10 lines): ALL CAPS lines and agreement keywords
+    # Method 2 (first 15 lines): typical agreement/contract terms
+    # Both are scored in one pass over the lines; the best score wins, and on a
+    # tie the earliest line, as max() over the candidate list did
+    best_title, best_score = None, 0
+    for i, line in enumerate(non_empty_lines[:15]):
+        word_count = len(line.split())
+        line_lower = line.lower()
+        score = 0
+        
+        if i < 10:
             # Strong title indicators: all caps + "AGREEMENT"/"CONTRACT"/"LICENSE"
-            if line.isupper() and len(line.split()) >= 2 and len(line.split()) <= 15:
-                if any(keyword in line for keyword in ["AGREEMENT", "CONTRACT", "LICENSE", "LEASE"]):
-                    potential_titles.append((line, 10))  # High confidence score
+            if line.isupper() and word_count >= 2 and word_count <= 15:
+                if STRONG_TITLE_KEYWORD_PATTERN.search(line):
+                    score = 10  # High confidence score
                 else:
-                    potential_titles.append((line, 5))   # Medium confidence
+                    score = 5   # Medium confidence
             # Mixed case but has agreement keywords
-            elif any(keyword in line.upper() for keyword in ["AGREEMENT", "CONTRACT", "LICENSE"]):
-                potential_titles.append((line, 8))
-                
-    # Method 2: Look for lines containing typical agreement/contract terms
-    agreement_types = ["service", "employment", "non-disclosure", "confidentiality", 
-                      "sale", "purchase", "master", "subscription", "consulting", 
-                      "license", "partnership", "distribution", "supply"]
+            elif TITLE_KEYWORD_PATTERN.search(line):
+                score = 8
+        
+        if AGREEMENT_TYPE_PATTERN.search(line_lower):
+            score = max(score, 9)
+        elif "agreement" in line_lower and word_count <= 10:
+            score = max(score, 7)
+        
+        if score > best_score:
+            best_title, best_score = line, score
+            # 10 is the top score, so no later line can beat this one
+            if best_score >= 10:
+                break
     
-    for i, line in enumerate(non_empty_lines[:15]):  # Check more lines for this method
-        line_lower = line.lower()
-        if any(f"{term} agreement" in line_lower for term in agreement_types):
-            potential_titles.append((line, 9))
-        elif "agreement" in line_lower and len(line.split()) <= 10:
-            potential_titles.append((line, 7))
-                
     # Select the best title based on confidence score
-    if potential_titles:
-        best_title = max(potential_titles, key=lambda x: x[1])[0]
+    if best_title is not None:
         metadata["title"] = best_title
     # If no title found with confidence, use the first non-empty line as last resort
     elif non_empty_lines:
@@ -34,6 +34,11 @@ import spacy
 from transformers import pipeline
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from model_utils import optimize_pipeline
+
+# Run spaCy on the GPU when one is available; falls back to the CPU otherwise
+spacy.prefer_gpu()
+
 # Initialize NLP models
 nlp = spacy.load("en_core_web_lg")
 contractbert_ner = None
@@ -47,11 +52,15 @@ def load_nlp_models():
     
     # Load ContractBERT models
     print("Loading ContractBERT NER model...")
-    contractbert_ner = pipeline("token-classification", model="nlpaueb/legal-bert-base-uncased", aggregation_strategy="simple")
+    contractbert_ner = optimize_pipeline(
+        pipeline("token-classification", model="nlpaueb/legal-bert-base-uncased", aggregation_strategy="simple")
+    )
     print("ContractBERT NER model loaded successfully.")
     
     print("Loading ContractBERT classifier model...")
-    contractbert_classifier = pipeline("text-classification", model="nlpaueb/legal-bert-base-uncased")
+    contractbert_classifier = optimize_pipeline(
+        pipeline("text-classification", model="nlpaueb/legal-bert-base-uncased")
+    )
     print("ContractBERT classifier model loaded successfully.")
 
 def extract_key_information(json_file: str) -> Dict[str, Any]:
@@ -96,8 +105,8 @@ def get_full_text(data: List[Dict[str, Any]]) -> str:
     """Extract full text from all pages of the contract."""
     full_text = ""
     if data and len(data) > 0 and "pages" in data[0]:
-        for page in data[0]["pages"]:
-            full_text += page.get("text", "") + " "
+        # Join once instead of re-copying the growing string for every page
+        full_text = "".join(page.get("text", "") + " " for page in data[0]["pages"])
     return full_text
 
 
@@ -30,12 +30,17 @@ from extract.txt_parser import (
 
 # Import Cypher generation functionality
 from cypher_generator import process_json_file
+from admin_import import write_admin_import_csv
+from model_utils import optimize_pipeline
 
 # Import constants
 from contract_constants import (
     DATE_CONTEXTS, FINANCIAL_PATTERNS, DATE_PATTERNS, KEY_TERM_PATTERNS
 )
 
+# Run spaCy on the GPU when one is available; falls back to the CPU otherwise
+spacy.prefer_gpu()
+
 # Load SpaCy model - using the large model for better accuracy
 nlp = spacy.load("en_core_web_lg")
 
@@ -52,17 +57,18 @@ def initialize_contractbert():
     try:
         # Initialize ContractBERT for named entity recognition using legal-bert
         # Note: Using nlpaueb/legal-bert-base-uncased which is available on HuggingFace
-        contractbert_ner = pipeline(
+        # Both models run at reduced precision (see optimize_pipeline)
+        contractbert_ner = optimize_pipeline(pipeline(
             "token-classification", 
             model="nlpaueb/legal-bert-base-uncased", 
             aggregation_strategy="simple"
-        )
+        ))
         
         # Initialize ContractBERT for text classification
-        contractbert_classifier = pipeline(
+        contractbert_classifier = optimize_pipeline(pipeline(
             "text-classification",
             model="nlpaueb/legal-bert-base-uncased"
-        )
+        ))
         
         # Initialize SpaCy for additional NLP tasks
         nlp = spacy.load("en_core_web_lg")
@@ -71,7 +77,7 @@ def initialize_contractbert():
     except Exception as e:
         print(f"Error initializing ContractBERT models: {e}", file=sys.stderr)
         # Initialize fallback functions instead of None to avoid NoneType errors
-        contractbert_ner = lambda x: []
+        contractbert_ner = lambda x, **kwargs: []
         contractbert_classifier = lambda x: [{"label": "UNKNOWN", "score": 0.0}]
         return False
 
@@ -149,8 +155,8 @@ def get_full_text(data: List[Dict[str, Any]]) -> str:
     """Extract full text from all pages of the contract."""
     full_text = ""
     if data and len(data) > 0 and "pages" in data[0]:
-        for page in data[0]["pages"]:
-            full_text += page.get("text", "") + " "
+        # Join once instead of re-copying the growing string for every page
+        full_text = "".join(page.get("text", "") + " " for page in data[0]["pages"])
     return full_text
 
 
@@ -559,6 +565,8 @@ def main():
                         help='Path to the fallback TXT file')
     parser.add_argument('--output', '-o', type=str, default="./data/sample_contract_enhanced.cypher",
                         help='Path to the output Cypher file')
+    parser.add_argument('--csv-dir', type=str, default=None,
+                        help='Also write neo4j-admin bulk import CSV files to this directory')
     
     # Parse arguments
     args = parser.parse_args()
@@ -590,6 +598,10 @@ def main():
         terms = extract_key_terms([{"articles": articles}])
         entities = extract_named_entities([{"articles": articles}])
         
+        # One import timestamp for every output of this run, so the Cypher
+        # script and the CSV files describe the same Contract node
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         # Call the process_json_file function with all extracted information
         process_json_file(
             input_file, 
@@ -601,8 +613,25 @@ def main():
             financials,
             dates,
             terms,
-            entities
+            entities,
+            timestamp
         )
+        
+        # Optionally write the same graph for an offline neo4j-admin import
+        if args.csv_dir:
+            write_admin_import_csv(
+                input_file,
+                args.csv_dir,
+                metadata,
+                articles,
+                parties,
+                key_provisions,
+                financials,
+                dates,
+                terms,
+                entities,
+                timestamp
+            )
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
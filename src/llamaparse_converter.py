@@ -15,6 +15,11 @@ from datetime import datetime
 import spacy
 from transformers import pipeline
 
+from model_utils import optimize_pipeline
+
+# Run spaCy on the GPU when one is available; falls back to the CPU otherwise
+spacy.prefer_gpu()
+
 # Load NLP models
 nlp = spacy.load("en_core_web_lg")
 contractbert_ner = None
@@ -25,13 +30,13 @@ def initialize_nlp_models():
     global contractbert_ner, contractbert_classifier
     
     print("Loading ContractBERT NER model...")
-    contractbert_ner = pipeline("token-classification", 
-                               model="nlpaueb/legal-bert-base-uncased", 
-                               aggregation_strategy="simple")
+    contractbert_ner = optimize_pipeline(pipeline("token-classification", 
+                                                  model="nlpaueb/legal-bert-base-uncased", 
+                                                  aggregation_strategy="simple"))
     
     print("Loading ContractBERT classifier model...")
-    contractbert_classifier = pipeline("text-classification", 
-                                     model="nlpaueb/legal-bert-base-uncased")
+    contractbert_classifier = optimize_pipeline(pipeline("text-classification", 
+                                                         model="nlpaueb/legal-bert-base-uncased"))
     
     print("NLP models loaded successfully")
 
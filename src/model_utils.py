@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Model Utilities
+
+Helpers shared by the scripts that load the ContractBERT pipelines.
+"""
+
+import os
+
+# Set CONTRACTBERT_QUANTIZE=1 to run the ContractBERT models at reduced
+# precision. Off by default: it shifts the NER and classifier scores the
+# extraction thresholds were tuned against
+QUANTIZE_MODELS = os.environ.get("CONTRACTBERT_QUANTIZE", "0") == "1"
+
+
+def optimize_pipeline(nlp_pipeline):
+    """Switch a transformers pipeline's model to reduced precision for inference.
+    
+    On a GPU the weights are cast to float16. On the CPU the Linear layers,
+    where BERT spends nearly all of its time, are dynamically quantized to
+    int8 in place.
+    
+    Returns:
+        The same pipeline, so the call can wrap pipeline(...) directly
+    """
+    if not QUANTIZE_MODELS:
+        return nlp_pipeline
+    
+    import torch
+    
+    if nlp_pipeline.device.type == "cuda":
+        nlp_pipeline.model.half()
+    else:
+        torch.ao.quantization.quantize_dynamic(
+            nlp_pipeline.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    return nlp_pipeline
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test Section Extraction Script
+
+This script checks that the TXT parser finds the numbered sections of the
+sample contract, including those that follow a line ending in a single letter.
+"""
+
+import os
+import sys
+
+# Add the src directory to the path so we can import the extract module
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, 'src'))
+from extract.txt_parser import extract_articles_from_text
+
+def test_txt_section_extraction():
+    """Test the numbered sections found in the sample TXT file"""
+    txt_file_path = os.path.join(script_dir, 'data', 'sample_contract.txt')
+    with open(txt_file_path, 'r', encoding='utf-8') as f:
+        txt_content = f.read()
+    
+    articles = extract_articles_from_text(txt_content)
+    sections = [section for article in articles for section in article["sections"]]
+    numbers = [section["number"] for section in sections]
+    
+    expected_sections = ["1.1", "1.2", "1.3", "1.4", "1.5", "2.1", "2.2", "3.1",
+                         "7.1", "9.1", "9.2", "10.1", "10.2", "10.3", "10.4"]
+    
+    print("Testing TXT section extraction...")
+    missing = []
+    for number in expected_sections:
+        if number in numbers:
+            print(f"✓ PASS - Section {number} found")
+        else:
+            print(f"✗ FAIL - Section {number} not found")
+            missing.append(number)
+    
+    # A numbered header must not end up inside another section's title
+    swallowed = [section["number"] for section in sections
+                 if any(section["title"].startswith(number) for number in expected_sections)]
+    if swallowed:
+        print(f"✗ FAIL - Numbered headers swallowed by sections {swallowed}")
+    
+    assert not missing and not swallowed
+
+if __name__ == "__main__":
+    test_txt_section_extraction()
+    print("\nSection extraction testing complete!")